@@ -14,10 +14,11 @@ class MenuBar(QWidget):
                  flags: typing.Union[QtCore.Qt.WindowFlags, QtCore.Qt.WindowType] = QtCore.Qt.WindowType.Widget) -> None:
         super().__init__(parent, flags)
 
-        self.setLayout(QHBoxLayout(self))
-        self.layout().setContentsMargins(0, 0, 0, 0)
-        self.layout().setSpacing(0)
-        # self.layout().setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        # layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.setLayout(layout)
         self.setContentsMargins(0, 0, 0, 0)
 
         self.setSizePolicy(QSizePolicy.Policy.MinimumExpanding,
@@ -31,12 +32,13 @@ class MenuBar(QWidget):
                 for w in widget:
                     self.add(w)
             else:
+                layout = self.layout()
                 if issubclass(widget.__class__, QWidget):
-                    self.layout().addWidget(widget)
+                    layout.addWidget(widget)
                 elif issubclass(widget.__class__, QSpacerItem):
-                    self.layout().addItem(widget)
+                    layout.addItem(widget)
                 elif issubclass(widget.__class__, QLayout):
-                    self.layout().addLayout(widget)
+                    layout.addLayout(widget)
                 else:
                     raise TypeError(
                         f"Unexpected element of type {widget.__class__}")
@@ -8,6 +8,9 @@ Project :   PyQtTest
 '''
 import os
 
+# the directory containing the resource files
+_here = os.path.dirname(os.path.abspath(__file__))
+
 
 def list_all_files(ext: 'str | list[str] | None' = None) -> 'dict[str, str]':
     '''
@@ -23,9 +26,7 @@ def list_all_files(ext: 'str | list[str] | None' = None) -> 'dict[str, str]':
 
     if ext is not None and not hasattr(ext, '__iter__'):
         ext = [ext]
-    _file = __file__.replace('/', os.sep)
-    here = os.sep.join(_file.split(os.sep)[:-1])
-    for dirpath, _, filenames in os.walk(here):
+    for dirpath, _, filenames in os.walk(_here):
         for file in filenames:
             if ext is None or any([file.lower().endswith('.'+e) for e in ext]):
                 files[file] = os.path.join(dirpath, file)
@@ -46,10 +47,8 @@ def get_path_to_file(file: str) -> str:
     try:
         return list_all_files()[file]
     except KeyError:
-        _file = __file__.replace('/', os.sep)
-        here = os.sep.join(_file.split(os.sep)[:-1])
         raise FileNotFoundError(
-            f"could not find '{file}' in '{here}'") from None
+            f"could not find '{file}' in '{_here}'") from None
 
 
 if __name__ == '__main__':
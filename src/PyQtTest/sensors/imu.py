@@ -18,6 +18,10 @@ __all__ = [
 
 __default_orientation_sensor = OrientationSensor.get_default()
 
+# conversion constants
+_PI_HALF = math.pi/2
+_RAD2DEG = 180/math.pi
+
 
 def __get_current_quaternion() -> SensorQuaternion:
     '''get the current orientation in native quaternion form'''
@@ -29,7 +33,7 @@ def __quaternion_to_euler(q: SensorQuaternion) -> 'tuple[float, float, float]':
     '''transform a SensorQuaternion to en euler angle tuple of (roll, pitch, yaw)'''
     roll = math.asin(2*(q.w*q.y - q.z*q.x))
     pitch = math.atan2(2*(q.w*q.x + q.y*q.z),
-                       1-2*(q.x**2 + q.y**2)) - 3.1415926/2
+                       1-2*(q.x**2 + q.y**2)) - _PI_HALF
     yaw = math.atan2(2*(q.w*q.z + q.x*q.y),
                      1-2*(q.y**2 + q.z**2))
     return (roll, pitch, yaw)
@@ -42,7 +46,8 @@ def get_current_euler() -> 'tuple[float, float, float]':
 
 def get_current_euler_deg() -> 'tuple[float, float, float]':
     '''get the current orientation in euler angle form (degrees)'''
-    return tuple(a*180/3.1415926 for a in get_current_euler())
+    roll, pitch, yaw = get_current_euler()
+    return (roll*_RAD2DEG, pitch*_RAD2DEG, yaw*_RAD2DEG)
 
 
 def _main():
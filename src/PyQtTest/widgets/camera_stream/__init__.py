@@ -1,13 +1,88 @@
 
 import typing
 import logging
+import functools
 
 import os
 import cv2
+import numpy as np
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 
+class CaptureWorker(QtCore.QObject):
+    '''
+    grabs frames from a video capture device, meant to be run in a separate thread
+
+    @parameters :
+    * `device`  :   (optional) the index of the capture device to open
+    '''
+    frameReady = QtCore.pyqtSignal(object)
+
+    def __init__(self, device: int = 0) -> None:
+        super().__init__()
+        self._device = device
+        # set here rather than in run(), so a stop() that comes before the
+        # thread has started still ends the loop
+        self._running = True
+        self._pending = False
+        self._dropped_frames = 0
+        # two frame buffers, used in turn : one is being displayed while
+        # the next frame is decoded into the other
+        self._buffers = [None, None]
+        self._back = 0  # the index of the buffer to decode into
+
+    def run(self):
+        '''capture loop : runs until `stop()` is called'''
+        video = cv2.VideoCapture(self._device)
+        # ask the driver to only keep the latest frame queued
+        video.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        while self._running:
+            if not video.grab():
+                logging.debug('No image')
+                QtCore.QThread.msleep(30)
+                continue
+
+            if self._pending:
+                # the GUI has not picked up the previous frame yet
+                self._dropped_frames += 1
+                if self._dropped_frames >= 100:
+                    logging.debug(f'{self.__class__.__name__}: '
+                                  f'dropped {self._dropped_frames} stale frames')
+                    self._dropped_frames = 0
+                continue
+
+            # decode into the back buffer, to avoid allocating a new array
+            # for each frame, then swap buffers
+            ret, frame = video.retrieve(self._buffers[self._back])
+            if ret:
+                self._buffers[self._back] = frame
+                self._back ^= 1
+                self._pending = True
+                self.frameReady.emit(frame)
+
+        video.release()
+
+    def frameConsumed(self):
+        '''signal that the last emitted frame has been picked up, and the other buffer may be reused'''
+        self._pending = False
+
+    def stop(self):
+        '''stop the capture loop'''
+        self._running = False
+
+
+def _stop_capture(worker: CaptureWorker, thread: QtCore.QThread, *args):
+    '''internal function : stop the capture loop and wait for its thread to finish'''
+    worker.stop()
+    try:
+        thread.quit()
+        thread.wait()
+    except RuntimeError:
+        pass  # the thread is already gone, e.g. at interpreter exit
+
+
 class CameraStreamer(QtWidgets.QFrame):
     def __init__(self, parent: typing.Optional[QtWidgets.QWidget] = None,
                  image: typing.Optional[QtGui.QImage] = None,
@@ -15,14 +90,32 @@ class CameraStreamer(QtWidgets.QFrame):
                                      QtCore.Qt.WindowType] = QtCore.Qt.WindowType.Widget) -> None:
         super().__init__(parent, flags)
         self._image = QtGui.QImage() if image is None else image
+        self._frame = None
+        self._image_pool = []  # the images wrapping the worker's frame buffers
+        self._scaled = QtGui.QImage()  # the image, scaled to fit the widget
         self._image_rect = QtCore.QRect()
 
-        self.video = cv2.VideoCapture(0)
-
-        self.timer = QtCore.QTimer(self)
-        self.timer.setInterval(30)
-        self.timer.timeout.connect(self._refresh_display)
-        self.timer.start()
+        # capture in a separate thread, so a slow camera doesn't block the GUI.
+        # the thread has no parent : child widgets don't get a closeEvent, so
+        # it is stopped when the widget is destroyed or the application quits,
+        # rather than being deleted with the widget while still running
+        self._capture_thread = QtCore.QThread()
+        self._capture_worker = CaptureWorker(0)
+        self._capture_worker.moveToThread(self._capture_thread)
+        self._capture_thread.started.connect(self._capture_worker.run)
+        self._capture_thread.finished.connect(self._capture_worker.deleteLater)
+        self._capture_worker.frameReady.connect(self._on_frame)
+        # don't refer to self here, as it is already gone when destroyed is emitted
+        stop = functools.partial(_stop_capture, self._capture_worker, self._capture_thread)
+        self.destroyed.connect(stop)
+        QtCore.QCoreApplication.instance().aboutToQuit.connect(stop)
+        self._capture_thread.start()
+
+        # the whole widget is painted on every paint event, so there is no need
+        # for Qt to erase the background first
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
 
     def minimumSizeHint(self) -> QtCore.QSize:
         return QtCore.QSize(50, 50)
@@ -30,40 +123,70 @@ class CameraStreamer(QtWidgets.QFrame):
     def image(self) -> QtGui.QImage:
         return self._image
 
-    def _refresh_display(self):
-        ret, frame = self.video.read()
-
-        if ret:
-            self._image = QtGui.QImage(frame,
-                                       frame.shape[1],
-                                       frame.shape[0],
-                                       QtGui.QImage.Format.Format_BGR888)
-            self.update()
+    def rawFrame(self) -> typing.Optional[np.ndarray]:
+        '''the last captured frame as a BGR array, or None if nothing has been captured yet'''
+        return self._frame
+
+    def _on_frame(self, frame):
+        '''internal callback : display a newly captured frame'''
+        # the worker alternates between two buffers, so the image only
+        # needs to be created if the buffer itself is new
+        for buffer, image in self._image_pool:
+            if buffer is frame:
+                break
         else:
-            logging.debug('No image')
+            # wrap the frame without copying. The stride must be given explicitly,
+            # and the frame kept alive for as long as the image refers to it.
+            image = QtGui.QImage(frame.data,
+                                 frame.shape[1],
+                                 frame.shape[0],
+                                 frame.strides[0],
+                                 QtGui.QImage.Format.Format_BGR888)
+            self._image_pool = self._image_pool[-1:] + [(frame, image)]
+        self._frame, self._image = frame, image
+        self._rescale()
+        # the worker may now decode into the other buffer
+        self._capture_worker.frameConsumed()
+        self.update()
+
+    def _rescale(self):
+        '''internal function : scale the image to the widget size for display'''
+        size = self._image.size().scaled(self.size(),
+                                         QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+        # keep the dimensions even, which avoids half-pixel offsets when centering
+        self._image_rect.setSize(QtCore.QSize(size.width() & ~1,
+                                              size.height() & ~1))
+        self._image_rect.moveCenter(self.rect().center())
+        # this is only a preview, so there is no need for smooth scaling
+        self._scaled = self._image.scaled(self._image_rect.size(),
+                                          QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+                                          QtCore.Qt.TransformationMode.FastTransformation)
+
+    def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
+        if not self._image.isNull():
+            self._rescale()
+        return super().resizeEvent(a0)
 
     def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
 
         if self._image.isNull():
             with QtGui.QPainter(self) as p:
+                p.fillRect(self.rect(), self.palette().window())
                 p.drawText(self.rect(),
                            QtCore.Qt.AlignmentFlag.AlignCenter,
                            "no img")
 
         else:
-            self._image_rect.setSize(
-                self._image.size().scaled(self.size(),
-                                          QtCore.Qt.AspectRatioMode.KeepAspectRatio))
-            self._image_rect.moveCenter(self.rect().center())
-
             with QtGui.QPainter(self) as p:
-                p.drawImage(self._image_rect,
-                            self._image,
-                            self._image.rect())
+                p.drawImage(self._image_rect.topLeft(), self._scaled)
+                # the background is not erased, so fill in the bars around the image
+                bars = QtGui.QRegion(a0.rect()).subtracted(
+                    QtGui.QRegion(self._image_rect))
+                for bar in bars.rects():
+                    p.fillRect(bar, self.palette().window())
 
     def closeEvent(self, a0: QtGui.QCloseEvent) -> None:
-        self.timer.stop()
-        self.video.release()
+        _stop_capture(self._capture_worker, self._capture_thread)
         self.deleteLater()
         return super().closeEvent(a0)
 
@@ -78,16 +201,22 @@ class PathWidget(QtWidgets.QFrame):
 
         self._path_segments: 'list[QtWidgets.QLineEdit]' = []
 
-        self.setLayout(QtWidgets.QHBoxLayout(self))
-        self.layout().setSpacing(0)
-        self.layout().setContentsMargins(*4*[0])
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.setSpacing(0)
+        layout.setContentsMargins(*4*[0])
+        self.setLayout(layout)
         self.setContentsMargins(*4*[0])
 
     def _remove_all(self):
-        for i in range(self.layout().count()):
-            w = self.layout().takeAt(i)
+        # always take the first item, since taking an item shifts the others
+        layout = self.layout()
+        while layout.count() > 0:
+            w = layout.takeAt(0).widget()
             if isinstance(w, QtWidgets.QLineEdit):
                 w.editingFinished.disconnect(self.pathChanged)
+            if w is not None:
+                w.setParent(None)
+                w.deleteLater()
 
     def setDepth(self, depth: int):
         if len(self._path_segments) > 0:
@@ -95,10 +224,11 @@ class PathWidget(QtWidgets.QFrame):
 
         self._path_segments = [QtWidgets.QLineEdit(self) for i in range(depth)]
 
+        layout = self.layout()
         for segment in self._path_segments:
-            self.layout().addWidget(segment)
+            layout.addWidget(segment)
             if segment is not self._path_segments[-1]:
-                self.layout().addWidget(QtWidgets.QLabel(os.sep, self))
+                layout.addWidget(QtWidgets.QLabel(os.sep, self))
             segment.editingFinished.connect(self.pathChanged)
 
     def setPath(self, path: str):
@@ -144,9 +274,10 @@ class SimpleCamera(QtWidgets.QFrame):
         bottom_bar.addWidget(self.destination_selector)
         bottom_bar.addWidget(self.trigger_button)
 
-        self.setLayout(QtWidgets.QVBoxLayout(self))
-        self.layout().addWidget(self.stream_display)
-        self.layout().addLayout(bottom_bar)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(self.stream_display)
+        layout.addLayout(bottom_bar)
+        self.setLayout(layout)
 
     def setRootFolder(self, *, folder: str = None):
         if folder is None:
@@ -177,7 +308,18 @@ class SimpleCamera(QtWidgets.QFrame):
         if not (os.path.isdir(self._destination_folder)):
             os.makedirs(self._destination_folder)
 
-        # save image
-        if not self.stream_display.image().save(outfile):
+        # save image : write the raw frame directly with OpenCV if possible,
+        # which avoids converting it back from a QImage
+        frame = self.stream_display.rawFrame()
+        if frame is not None:
+            ok = cv2.imwrite(outfile, frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
+        else:
+            ok = self.stream_display.image().save(outfile)
+        if not ok:
             logging.error(
                 f"{self.__class__.__name__}: failed to write {outfile}")
+
+    def closeEvent(self, a0: QtGui.QCloseEvent) -> None:
+        # make sure the stream's capture thread is stopped
+        self.stream_display.close()
+        return super().closeEvent(a0)
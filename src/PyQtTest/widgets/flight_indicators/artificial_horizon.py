@@ -11,16 +11,28 @@ __all__ = [
     'ArtificalHorizon'
 ]
 
+import cv2
 import math
 import typing
+import functools
+import numpy as np
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
+# the roll graduations are fixed, so their trigonometry only needs computing once
+_ROLL_MARKS = np.arange(-40, 50, 10)
+_ROLL_SIN = np.sin(np.deg2rad(_ROLL_MARKS))
+_ROLL_COS = np.cos(np.deg2rad(_ROLL_MARKS))
+
 
 class AbstractArtificalHorizon(QtWidgets.QFrame):
     def __init__(self, parent: typing.Optional[QtWidgets.QWidget] = None,
                  flags: typing.Union[QtCore.Qt.WindowFlags, QtCore.Qt.WindowType] = QtCore.Qt.WindowType.Widget) -> None:
         super().__init__(parent, flags)
+        self._instrument_bbox = QtCore.QRect()
+        self._overlay_bbox = QtCore.QRect()
+        self._static_labels: 'dict[str, tuple[QtGui.QStaticText, int]]' = {}
+        self._pens: 'dict[tuple[QtGui.QPalette.ColorRole, int], QtGui.QPen]' = {}
         self.setRoll(0, -30, 30, 5)
         self.setPitch(0, -30, 30, 10)
 
@@ -29,31 +41,104 @@ class AbstractArtificalHorizon(QtWidgets.QFrame):
 
     def setRoll(self, roll: float, min_roll: int = None, max_roll: int = None, roll_ticks: int = None):
         self._roll = float(roll)
+        # only build the transform once it is painted, so quick successive
+        # changes (e.g. dragging a slider) don't each pay for it
+        self._roll_transform = None
         if min_roll is not None:
             self._min_roll = int(min_roll)
         if max_roll is not None:
             self._max_roll = int(max_roll)
         if roll_ticks is not None:
             self._roll_ticks = int(roll_ticks)
-        self.update()
+        self.update(self._instrument_bbox)
 
     def pitch(self) -> float:
         return self._pitch
 
     def setPitch(self, pitch: float, min_pitch: int = None, max_pitch: int = None, pitch_ticks: int = None):
         self._pitch = float(pitch)
+        # the start and span angles of the sky chord, in 1/16th of a degree
+        self._chord_start = int(-self._pitch * 16)
+        self._chord_span = int((180 + 2*self._pitch) * 16)
         if min_pitch is not None:
             self._min_pitch = int(min_pitch)
         if max_pitch is not None:
             self._max_pitch = int(max_pitch)
         if pitch_ticks is not None:
             self._pitch_ticks = int(pitch_ticks)
-        self.update()
+        self.update(self._instrument_bbox)
+
+    def _get_roll_transform(self) -> QtGui.QTransform:
+        '''internal function : the (cached) transform rotating the moving parts around the center of the widget'''
+        if self._roll_transform is None:
+            center = self.rect().center()
+            self._roll_transform = QtGui.QTransform() \
+                .translate(center.x(), center.y()) \
+                .rotate(-self._roll) \
+                .translate(-center.x(), -center.y())
+        return self._roll_transform
+
+    def _static_label(self, text: str) -> 'tuple[QtGui.QStaticText, int]':
+        '''internal function : the (cached) laid out text of a label, and its width'''
+        try:
+            return self._static_labels[text]
+        except KeyError:
+            lbl = QtGui.QStaticText(text)
+            lbl.prepare(QtGui.QTransform(), self.font())
+            cached = self._static_labels[text] = (lbl, self.fontMetrics().boundingRect(text).width())
+            return cached
+
+    def _pen(self, role: QtGui.QPalette.ColorRole, width: int) -> QtGui.QPen:
+        '''internal function : the (cached) pen for drawing in the given palette color'''
+        try:
+            return self._pens[(role, width)]
+        except KeyError:
+            pen = self._pens[(role, width)] = QtGui.QPen(self.palette().color(role), width)
+            return pen
+
+    def changeEvent(self, a0: QtCore.QEvent) -> None:
+        if a0.type() == QtCore.QEvent.Type.FontChange:
+            self._static_labels.clear()
+            if hasattr(self, '_pitch_labels'):  # i.e. it has been resized already
+                self._create_pitch_labels()
+        if a0.type() == QtCore.QEvent.Type.PaletteChange:
+            self._pens.clear()
+        return super().changeEvent(a0)
 
     def _height_from_pitch(self, pitch) -> int:
-        return self._square.center().y() + (self._square.height() * math.sin(pitch/180*3.1415926))//2
+        # the graduation heights are already known, only compute the others
+        try:
+            return self._pitch_heights[pitch]
+        except KeyError:
+            return self._horizon_y + int((self._horizon_scale * math.sin(math.radians(pitch)))//2)
+
+    @staticmethod
+    def _point_pairs(x: np.ndarray, y: np.ndarray) -> QtGui.QPolygon:
+        '''pack (N, 2) arrays of line end-point coordinates into a QPolygon for `drawLines`'''
+        polygon = QtGui.QPolygon(x.size)
+        if x.size:
+            # write the coordinates straight into the polygon's buffer
+            buffer = polygon.data()
+            buffer.setsize(2 * x.size * np.dtype(np.intc).itemsize)
+            points = np.frombuffer(buffer, dtype=np.intc).reshape(-1, 2)
+            points[:, 0], points[:, 1] = x.ravel(), y.ravel()
+        return polygon
+
+    def _create_pitch_labels(self):
+        '''internal function for laying out the pitch labels - should be called only on resize or font change'''
+        # the labels are laid out only once, so painting them is just a blit,
+        # and resizing only moves them.
+        # static text is positioned by its top left corner, not its baseline.
+        cx = self._square.center().x()
+        ascent = self.fontMetrics().ascent()
+        self._pitch_labels = []
+        for pitch_mark, h in self._pitch_heights.items():
+            lbl, width = self._static_label(f"{pitch_mark}°")
+            self._pitch_labels.append((lbl, QtCore.QPoint(cx - width//2, h - 3 - ascent)))
 
     def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
+        self._roll_transform = None  # the center has moved
+
         # get the largest possible square
         margin = 10
         if self.rect().width() < self.rect().height()-2*margin:
@@ -67,8 +152,15 @@ class AbstractArtificalHorizon(QtWidgets.QFrame):
                                         self.rect().height()-2*margin,
                                         self.rect().height()-2*margin)
 
+        # the area affected by a change in roll or pitch : the bounding box of the
+        # rotated square, plus some room for the lines drawn on its edge
+        r = math.ceil(self._square.width() * math.sqrt(2) / 2) + 2*self.lineWidth()
+        self._instrument_bbox = QtCore.QRect(0, 0, 2*r, 2*r)
+        self._instrument_bbox.moveCenter(self.rect().center())
+        self._instrument_bbox = self._instrument_bbox.intersected(self.rect())
+
         # reticule geometry :
-        self._reticule = [
+        self._reticule = QtGui.QPolygon([
             QtCore.QPoint(self._square.center().x() - self._square.width()//4,
                           self._square.center().y()),
             QtCore.QPoint(self._square.center().x() - self._square.width()//10,
@@ -79,7 +171,7 @@ class AbstractArtificalHorizon(QtWidgets.QFrame):
                           self._square.center().y()),
             QtCore.QPoint(self._square.center().x() + self._square.width()//4,
                           self._square.center().y())
-        ]
+        ])
 
         # roll indicator geometry :
         self._roll_indicator = QtGui.QPolygon([
@@ -92,29 +184,34 @@ class AbstractArtificalHorizon(QtWidgets.QFrame):
         ])
 
         # pitch graduation geometry :
-        self._pitch_graduations = []
-        for pitch_mark in range(self._min_pitch, self._max_pitch+self._pitch_ticks, self._pitch_ticks):
-            lbl = f"{pitch_mark}°"
-            h = self._height_from_pitch(pitch_mark)
-            mark = QtCore.QLine(self._square.center().x()-self._square.width()//30-2*abs(pitch_mark), h,
-                                self._square.center().x()+self._square.width()//30+2*abs(pitch_mark), h)
-            pos = QtCore.QPoint(self._square.center().x() - self.fontMetrics().boundingRect(lbl).width()//2,
-                                h - 3)
-            self._pitch_graduations.append((mark, lbl, pos))
+        # the marks are stored as pairs of points, so they can be drawn in one call
+        cx, cy = self._square.center().x(), self._square.center().y()
+        self._horizon_y, self._horizon_scale = cy, self._square.height()
+        pitch_marks = np.arange(self._min_pitch,
+                                self._max_pitch+self._pitch_ticks,
+                                self._pitch_ticks)
+        heights = (cy + (self._horizon_scale *
+                         np.sin(np.radians(pitch_marks)))//2).astype(int)
+        self._pitch_heights = dict(zip(pitch_marks.tolist(), heights.tolist()))
+        self._horizon_cache = (None, 0)  # the last (pitch, height) of the horizon
+        half_widths = self._square.width()//30 + 2*np.abs(pitch_marks)
+        self._pitch_marks = self._point_pairs(np.stack([cx - half_widths, cx + half_widths], axis=1),
+                                              np.stack([heights, heights], axis=1))
+        self._create_pitch_labels()
 
         # roll graduations :
-        self._roll_graduations = []
         ro = self._square.height()//2 + 1
         ri = ro + 5
-        for roll_mark in range(-40, 50, 10):
-            # lbl = f"{roll_mark}°"
-            s = math.sin(roll_mark/180*3.1415926)
-            c = math.cos(roll_mark/180*3.1415926)
-            mark = QtCore.QLine(self._square.center().x() + int(s*ro),
-                                self._square.center().y() - int(c*ro),
-                                self._square.center().x() + int(s*ri),
-                                self._square.center().y() - int(c*ri))
-            self._roll_graduations.append(mark)
+        radii = np.array([ro, ri])
+        s = _ROLL_SIN[:, np.newaxis] * radii
+        c = _ROLL_COS[:, np.newaxis] * radii
+        self._roll_graduations = self._point_pairs(cx + s.astype(int),
+                                                   cy - c.astype(int))
+
+        # the area covered by the static overlay
+        lw = self.lineWidth()
+        self._overlay_bbox = self._reticule.boundingRect().united(
+            self._roll_graduations.boundingRect()).adjusted(-lw, -lw, lw, lw)
 
         a0.accept()
 
@@ -142,46 +239,45 @@ class SimpleArtificalHorizon(AbstractArtificalHorizon):
         return QtCore.QSize(500, 500)
 
     def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
-        # 1) paint the moving background
-        with QtGui.QPainter(self) as bg:
-            bg: QtGui.QPainter  # for type hinting
-            bg.setPen(QtCore.Qt.PenStyle.NoPen)  # no outlines
+        with QtGui.QPainter(self) as p:
+            p: QtGui.QPainter  # for type hinting
+
+            # 1) paint the moving background
+            # only repaint what is needed, and keep the moving parts inside the
+            # area which is updated on roll/pitch changes
+            p.setClipRegion(a0.region().intersected(self._instrument_bbox))
+            p.setPen(QtCore.Qt.PenStyle.NoPen)  # no outlines
 
             # apply roll
-            bg.translate(self.rect().center())
-            bg.rotate(-self._roll)
-            bg.translate(-self.rect().center())
+            p.setWorldTransform(self._get_roll_transform())
 
             # draw the ground
-            bg.setBrush(self.palette().base())
-            bg.drawEllipse(self._square)
+            p.setBrush(self.palette().base())
+            p.drawChord(self._square, self._chord_start + self._chord_span, 360*16 - self._chord_span)
             # draw the sky
-            bg.setBrush(self.palette().alternateBase())
-            bg.drawChord(self._square,
-                         -self._pitch * 16,
-                         (180+2*self._pitch)*16)
+            p.setBrush(self.palette().alternateBase())
+            p.drawChord(self._square, self._chord_start, self._chord_span)
 
             # draw roll indicator
-            bg.setBrush(self.palette().brightText())
-            bg.drawConvexPolygon(self._roll_indicator)
+            p.setBrush(self.palette().brightText())
+            p.drawConvexPolygon(self._roll_indicator)
 
             # draw graduations
-            bg.setPen(QtCore.Qt.PenStyle.SolidLine)
-            for mark, lbl, pos in self._pitch_graduations:
-                bg.drawLine(mark)
-                bg.drawText(pos, lbl)
+            p.setPen(QtCore.Qt.PenStyle.SolidLine)
+            p.drawLines(self._pitch_marks)
+            for lbl, pos in self._pitch_labels:
+                p.drawStaticText(pos, lbl)
+            # only the transform has to be undone, the overlay sets its own clip and pens
+            p.resetTransform()
 
-        # 2) paint the static overlay (foreground
-        with QtGui.QPainter(self) as fg:
-            fg: QtGui.QPainter  # for type hinting
-            fg.setPen(QtGui.QPen(self.palette().brightText().color(),
-                                 self.lineWidth()))
-            fg.drawPolyline(*self._reticule)
+            # 2) paint the static overlay (foreground), unless it is outside the repainted area
+            if a0.region().intersects(self._overlay_bbox):
+                p.setClipRegion(a0.region())
+                p.setPen(self._pen(QtGui.QPalette.ColorRole.BrightText, self.lineWidth()))
+                p.drawPolyline(self._reticule)
 
-            fg.setPen(QtGui.QPen(self.palette().windowText().color(),
-                                 self.lineWidth()))
-            for mark in self._roll_graduations:
-                fg.drawLine(mark)
+                p.setPen(self._pen(QtGui.QPalette.ColorRole.WindowText, self.lineWidth()))
+                p.drawLines(self._roll_graduations)
 
 
 class HUDArtificalHorizon(AbstractArtificalHorizon):
@@ -195,6 +291,7 @@ class HUDArtificalHorizon(AbstractArtificalHorizon):
                           QtGui.QColor('yellow'))
     lightPalette.setColor(QtGui.QPalette.ColorRole.BrightText,
                           QtGui.QColor('lime'))
+    _blurred = False  # roll and pitch are already set before __init__ gets to it
 
     def __init__(self, parent: typing.Optional[QtWidgets.QWidget] = None,
                  flags: typing.Union[QtCore.Qt.WindowFlags, QtCore.Qt.WindowType] = QtCore.Qt.WindowType.Widget) -> None:
@@ -203,9 +300,11 @@ class HUDArtificalHorizon(AbstractArtificalHorizon):
         self.setPalette(self.darkPalette)
         self.setLineWidth(3)
 
-        self.blur = QtWidgets.QGraphicsBlurEffect(self)
-        self.blur.setBlurRadius(1.5)
-        self.setGraphicsEffect(self.blur)
+        # the blur is applied to an offscreen image, rather than using a
+        # QGraphicsBlurEffect which re-blurs the whole widget on every repaint
+        self._blur_radius = 1.5
+        self._blur_margin = math.ceil(3 * self._blur_radius)  # the radius of the blur kernel
+        self._scratch = QtGui.QImage()
         self.setBlurred(False)
 
     def sizeHint(self) -> QtCore.QSize:
@@ -213,47 +312,122 @@ class HUDArtificalHorizon(AbstractArtificalHorizon):
 
     def setBlurred(self, active):
         '''enable/disable a slight blur effect to make the HUD more HUD-y'''
-        self.blur.setEnabled(active)
+        self._blurred = bool(active)
+        self.update()
+
+    def blurred(self) -> bool:
+        '''is the blur effect active'''
+        return self._blurred
+
+    def setRoll(self, roll: float, *args, **kwargs):
+        # the horizon line is not confined to the instrument, so repaint
+        # wherever it was and wherever it goes as well
+        old_horizon = self._horizon_region()
+        super().setRoll(roll, *args, **kwargs)
+        self._update_moving(old_horizon.united(self._horizon_region()))
+
+    def setPitch(self, pitch: float, *args, **kwargs):
+        old_horizon = self._horizon_region()
+        super().setPitch(pitch, *args, **kwargs)
+        self._update_moving(old_horizon.united(self._horizon_region()))
+
+    def _update_moving(self, horizon: QtGui.QRegion):
+        '''internal function : schedule a repaint of the moving parts'''
+        if self._blurred:
+            # the blur spreads the changes a little beyond the moving parts
+            m = self._blur_margin
+            self.update(horizon.united(self._instrument_bbox.adjusted(-m, -m, m, m)))
+        else:
+            self.update(horizon)
+
+    def _horizon_region(self) -> QtGui.QRegion:
+        '''internal function : the area covered by the horizon line, which spans the whole widget'''
+        if self._instrument_bbox.isEmpty():
+            return QtGui.QRegion()  # not laid out yet
+        h = self._height_from_pitch(self._pitch)
+        d = self.width() + self.height()
+        w = self.lineWidth() + (self._blur_margin if self._blurred else 0)
+        line = QtCore.QRect(self.rect().center().x() - d, h - w, 2*d, 2*w)
+        return QtGui.QRegion(self._get_roll_transform().mapToPolygon(line))
+
+    def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(a0)
+        # (re-)allocate the offscreen image used for blurring
+        self._scratch = QtGui.QImage(self.size(),
+                                     QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        ptr = self._scratch.bits()
+        ptr.setsize(self._scratch.sizeInBytes())
+        self._scratch_view = np.ndarray((self._scratch.height(), self._scratch.width(), 4),
+                                        dtype=np.uint8, buffer=ptr,
+                                        strides=(self._scratch.bytesPerLine(), 4, 1))
 
     def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
-        # 1) paint the moving horizon
-        with QtGui.QPainter(self) as bg:
-            bg: QtGui.QPainter  # for type hinting
-            bg.setPen(QtGui.QPen(self.palette().highlight().color(),
-                                 self.lineWidth()))
+        # when blurring, paint to the offscreen image first. the blur needs the
+        # surroundings of the repainted area too, so these are repainted as well
+        if self._blurred:
+            m = self._blur_margin
+            dirty = a0.rect().adjusted(-m, -m, m, m).intersected(self.rect())
+            region = QtGui.QRegion(dirty)
+            roi = self._scratch_view[dirty.top():dirty.bottom()+1, dirty.left():dirty.right()+1]
+            roi[...] = 0  # transparent
+            target = self._scratch
+        else:
+            region = a0.region()
+            target = self
+
+        with QtGui.QPainter(target) as p:
+            p: QtGui.QPainter  # for type hinting
+
+            # 1) paint the moving horizon
+            # only repaint what is needed. the horizon line spans the whole widget
+            p.setClipRegion(region)
+            p.setPen(self._pen(QtGui.QPalette.ColorRole.Highlight, self.lineWidth()))
 
             # apply roll
-            bg.translate(self.rect().center())
-            bg.rotate(-self._roll)
-            bg.translate(-self.rect().center())
+            p.setWorldTransform(self._get_roll_transform())
 
-            # draw the ground
-            h = self._height_from_pitch(self._pitch)
-            bg.drawLine(-1000000, h, self.width()+1000000, h)
+            # draw the ground (the pitch rarely changes between repaints)
+            if self._horizon_cache[0] != self._pitch:
+                self._horizon_cache = (self._pitch,
+                                       self._height_from_pitch(self._pitch))
+            h = self._horizon_cache[1]
+            p.drawLine(-1000000, h, self.width()+1000000, h)
+
+            # keep the other moving parts inside the area which is updated on
+            # roll/pitch changes (the clip is set in device coordinates)
+            p.resetTransform()
+            p.setClipRegion(region.intersected(self._instrument_bbox))
+            p.setWorldTransform(self._get_roll_transform())
 
             # draw roll indicator
-            bg.setPen(QtCore.Qt.PenStyle.NoPen)
-            bg.setBrush(self.palette().highlight())
-            bg.drawConvexPolygon(self._roll_indicator)
+            p.setPen(QtCore.Qt.PenStyle.NoPen)
+            p.setBrush(self.palette().highlight())
+            p.drawConvexPolygon(self._roll_indicator)
 
             # draw graduations
-            bg.setPen(QtGui.QPen(self.palette().brightText().color(),
-                                 1))
-            for mark, lbl, pos in self._pitch_graduations:
-                bg.drawLine(mark)
-                bg.drawText(pos, lbl)
-
-        # 2) paint the static overlay (foreground)
-        with QtGui.QPainter(self) as fg:
-            fg: QtGui.QPainter
-            fg.setPen(QtGui.QPen(self.palette().highlight().color(),
-                                 self.lineWidth()))
-            fg.drawPolyline(*self._reticule)
-
-            fg.setPen(QtGui.QPen(self.palette().brightText().color(),
-                                 self.lineWidth()))
-            for mark in self._roll_graduations:
-                fg.drawLine(mark)
+            p.setPen(self._pen(QtGui.QPalette.ColorRole.BrightText, 1))
+            p.drawLines(self._pitch_marks)
+            for lbl, pos in self._pitch_labels:
+                p.drawStaticText(pos, lbl)
+            # only the transform has to be undone, the overlay sets its own clip and pens
+            p.resetTransform()
+
+            # 2) paint the static overlay (foreground), unless it is outside the repainted area
+            if region.intersects(self._overlay_bbox):
+                p.setClipRegion(region)
+                p.setPen(self._pen(QtGui.QPalette.ColorRole.Highlight, self.lineWidth()))
+                p.drawPolyline(self._reticule)
+
+                p.setPen(self._pen(QtGui.QPalette.ColorRole.BrightText, self.lineWidth()))
+                p.drawLines(self._roll_graduations)
+
+        # 3) blur the offscreen image in-place, and copy it to the widget
+        if self._blurred:
+            k = 2*self._blur_margin + 1
+            roi[...] = cv2.GaussianBlur(roi, (k, k), self._blur_radius)
+            r = a0.rect()
+            with QtGui.QPainter(self) as p:
+                p.drawImage(r, self._scratch, r)
 
 
 class HorizonTestWidget(QtWidgets.QWidget):
@@ -278,6 +452,53 @@ class HorizonTestWidget(QtWidgets.QWidget):
         return self.testWidget.sizeHint()
 
 
+class ImuWorker(QtCore.QObject):
+    '''
+    polls an orientation sensor, meant to be run in a separate thread
+
+    @parameters :
+    * `poll`        :   the function returning the current (roll, pitch, yaw) in degrees
+    * `interval`    :   (optional) the polling interval in ms
+    '''
+    orientationChanged = QtCore.pyqtSignal(float, float, float)
+
+    def __init__(self, poll: typing.Callable[[], 'tuple[float, float, float]'], interval: int = 20) -> None:
+        super().__init__()
+        self._poll = poll
+        self._interval = interval
+        # set here rather than in run(), so a stop() that comes before the
+        # thread has started still ends the loop
+        self._running = True
+        self._pending = False
+
+    def run(self):
+        '''polling loop : runs until `stop()` is called'''
+        while self._running:
+            # don't poll the sensor again until the GUI has picked up the last reading
+            if not self._pending:
+                self._pending = True
+                self.orientationChanged.emit(*self._poll())
+            QtCore.QThread.msleep(self._interval)
+
+    def orientationConsumed(self):
+        '''signal that the last emitted orientation has been handled'''
+        self._pending = False
+
+    def stop(self):
+        '''stop the polling loop'''
+        self._running = False
+
+
+def _stop_imu(worker: ImuWorker, thread: QtCore.QThread, *args):
+    '''internal function : stop the polling loop and wait for its thread to finish'''
+    worker.stop()
+    try:
+        thread.quit()
+        thread.wait()
+    except RuntimeError:
+        pass  # the thread is already gone, e.g. at interpreter exit
+
+
 class FunHorizonTestWidget(HUDArtificalHorizon):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
@@ -289,12 +510,28 @@ class FunHorizonTestWidget(HUDArtificalHorizon):
 
         from ...sensors import imu
 
-        def updateOrientation():
-            r, p, y = imu.get_current_euler_deg()
-            self.setRoll(r)
-            self.setPitch(p)
-
-        self.timer = QtCore.QTimer(self)
-        self.timer.setInterval(20)
-        self.timer.timeout.connect(updateOrientation)
-        self.timer.start()
+        # poll the sensor in a separate thread, so a slow reading doesn't block the GUI.
+        # the thread has no parent : child widgets don't get a closeEvent, so
+        # it is stopped when the widget is destroyed or the application quits,
+        # rather than being deleted with the widget while still running
+        self._imu_thread = QtCore.QThread()
+        self._imu_worker = ImuWorker(imu.get_current_euler_deg, 20)
+        self._imu_worker.moveToThread(self._imu_thread)
+        self._imu_thread.started.connect(self._imu_worker.run)
+        self._imu_thread.finished.connect(self._imu_worker.deleteLater)
+        self._imu_worker.orientationChanged.connect(self._on_orientation)
+        # don't refer to self here, as it is already gone when destroyed is emitted
+        stop = functools.partial(_stop_imu, self._imu_worker, self._imu_thread)
+        self.destroyed.connect(stop)
+        QtCore.QCoreApplication.instance().aboutToQuit.connect(stop)
+        self._imu_thread.start()
+
+    def _on_orientation(self, roll: float, pitch: float, yaw: float):
+        '''internal callback to update the orientation'''
+        self.setRoll(roll)
+        self.setPitch(pitch)
+        self._imu_worker.orientationConsumed()
+
+    def closeEvent(self, a0: QtGui.QCloseEvent) -> None:
+        _stop_imu(self._imu_worker, self._imu_thread)
+        return super().closeEvent(a0)
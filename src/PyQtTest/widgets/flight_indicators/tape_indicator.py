@@ -11,7 +11,10 @@ __all__ = [
     'TapeIndicator'
 ]
 
+import math
 import typing
+import functools
+import numpy as np
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
@@ -38,6 +41,10 @@ class AbstractTapeIndicator(QtWidgets.QFrame):
         self._major_tick_interval = .2  # default major tick interval
         self._minor_tick_frequency = 5  # default number of minor ticks per major tick
 
+        # caches for the generated ticks and their formatted labels
+        self._tick_cache = (None, None)
+        self._format_tick = functools.lru_cache(maxsize=256)(self._tick_formatstr.format)
+
     def setAlignment(self, alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignLeft):
         '''set the alignment of the widget. only `right`, `left`, `top` and `bottom` are allowed'''
         alignment = QtCore.Qt.AlignmentFlag(alignment)
@@ -62,6 +69,8 @@ class AbstractTapeIndicator(QtWidgets.QFrame):
 
     def setValue(self, value: float, formatstr: str = None):
         '''set the value to display'''
+        if formatstr is None and self._isCurrentValue(value):
+            return  # nothing to redraw
         self._value = float(value)
         if formatstr is not None:
             # try it out so any errors are thrown immedately
@@ -73,6 +82,11 @@ class AbstractTapeIndicator(QtWidgets.QFrame):
         '''get the current value being displayed'''
         return self._value
 
+    def _isCurrentValue(self, value: float) -> bool:
+        '''internal function : is `value` the value already being displayed (including its sign, for 0.)'''
+        value = float(value)
+        return value == self._value and math.copysign(1., value) == math.copysign(1., self._value)
+
     def setRelativeRange(self, low: float, high: float):
         '''set the upper and lower range to display'''
         if float(low) > 0:
@@ -81,6 +95,8 @@ class AbstractTapeIndicator(QtWidgets.QFrame):
         if float(high) < 0:
             raise ValueError(
                 f"Upper bound of the range must be >= 0, not {high}")
+        if (float(low), float(high)) == (self._lo, self._hi):
+            return
         self._lo = float(low)
         self._hi = float(high)
         self.update()
@@ -93,11 +109,14 @@ class AbstractTapeIndicator(QtWidgets.QFrame):
         '''set the tick mark spacing for major (labeled) ticks'''
         if float(interval) <= 0:
             raise ValueError(f"Major Tick interval must be greater than 0!")
+        if float(interval) == self._major_tick_interval and formatstr in (None, self._tick_formatstr):
+            return
         self._major_tick_interval = float(interval)
         if formatstr is not None:
             # try it out so any errors are thrown immedately
             formatstr.format(interval)
             self._tick_formatstr = str(formatstr)
+            self._format_tick = functools.lru_cache(maxsize=256)(self._tick_formatstr.format)
         self.update()
 
     def tickInterval(self) -> float:
@@ -108,6 +127,8 @@ class AbstractTapeIndicator(QtWidgets.QFrame):
         '''set the number of minor ticks per major (labeled) tick'''
         if int(freq) < 0:
             raise ValueError(f"Minor Tick frequency must be at least 0!")
+        if int(freq) == self._minor_tick_frequency:
+            return
         self._minor_tick_frequency = int(freq)
         self.update()
 
@@ -115,41 +136,59 @@ class AbstractTapeIndicator(QtWidgets.QFrame):
         '''get the number of minor ticks per major (labeled) tick'''
         return self._minor_tick_frequency
 
-    def _generate_ticks(self) -> 'tuple[list[tuple[str, float]], list[float]]':
-        '''generate the tick values'''
-        # 0) reset
-        major_ticks = []
-        minor_ticks = []
-
-        # 2) calculate the highest major tick
-        major_top = int((self._value + self._hi)/self._major_tick_interval) * \
+    def _tick_arrays(self, margin: float = 0.) -> 'tuple[list[str], np.ndarray, np.ndarray]':
+        '''
+        generate the tick values, as the major tick labels and the major and minor tick positions
+
+        @parameters :
+            margin :    extends the displayed range by this much on either side.
+                        the tick positions are then relative to the extended range.
+        '''
+        # the ticks only change if one of these does, so don't regenerate them for every repaint
+        key = (self._value, self._lo, self._hi, margin, self._major_tick_interval,
+               self._minor_tick_frequency, self._inverted, self._tick_formatstr)
+        if key == self._tick_cache[0]:
+            return self._tick_cache[1]
+
+        lo, hi = self._lo - margin, self._hi + margin
+        span = hi - lo
+
+        # 1) calculate the highest major tick
+        major_top = int((self._value + hi)/self._major_tick_interval) * \
             self._major_tick_interval
 
-        # 3) using this as a reference, generate all lower major ticks
-        for n in range(int((self._hi - self._lo)/self._major_tick_interval)):
-            val = major_top-n*self._major_tick_interval
-            pos = (self._value - val + self._hi) / (self._hi - self._lo)
-            major_ticks.append((self._tick_formatstr.format(val), pos))
+        # 2) using this as a reference, generate all lower major ticks
+        major_vals = major_top - \
+            np.arange(int(span/self._major_tick_interval)) * self._major_tick_interval
+        major_pos = (self._value - major_vals + hi) / span
 
-        # 4) if required, generate minor ticks
-        if self._minor_tick_frequency > 0:
+        # 3) if required, generate minor ticks
+        if self._minor_tick_frequency > 0 and major_pos.size > 0:
             minor_tick_interval = self._major_tick_interval / \
-                self._minor_tick_frequency / (self._hi - self._lo)
-            # 4.1) generate the minor ticks above the top-most major tick
-            minor_ticks = [
-                major_ticks[0][-1] - n * minor_tick_interval for n in range(1, self._minor_tick_frequency)]
+                self._minor_tick_frequency / span
+            offsets = np.arange(1, self._minor_tick_frequency) * minor_tick_interval
+            # the minor ticks above the top-most major tick, then all the ones below each major tick.
+            # the offsets lie strictly between two major ticks, so no minor tick ever lands on a
+            # major one and there is nothing to de-duplicate.
+            minor_pos = np.concatenate((major_pos[0] - offsets,
+                                        (major_pos[:, None] + offsets).ravel()))
+        else:
+            minor_pos = np.empty(0)
 
-            # 4.2) generate all the minor ticks below this
-            for _, pos in major_ticks:
-                minor_ticks.extend(
-                    pos + n*minor_tick_interval for n in range(1, self._minor_tick_frequency))
+        # 4) drop the ticks which would end up outside of the tape, before formatting their labels
+        visible = (major_pos >= 0.) & (major_pos <= 1.)
+        major_vals, major_pos = major_vals[visible], major_pos[visible]
+        minor_pos = minor_pos[(minor_pos >= 0.) & (minor_pos <= 1.)]
 
         # 5) apply inversion, if necessary
         if self._inverted:
-            major_ticks = [(l, 1-p) for l, p in major_ticks]
-            minor_ticks = [1-p for p in minor_ticks]
+            major_pos = 1 - major_pos
+            minor_pos = 1 - minor_pos
+
+        labels = list(map(self._format_tick, major_vals.tolist()))
 
-        return major_ticks, minor_ticks
+        self._tick_cache = (key, (labels, major_pos, minor_pos))
+        return labels, major_pos, minor_pos
 
 
 class TapeIndicator(AbstractTapeIndicator):
@@ -188,10 +227,167 @@ class TapeIndicator(AbstractTapeIndicator):
         self._minor_tick_length = 5  # px
         self._minor_tick_width = 1  # px
 
+        self._labels: 'dict[str, tuple[QtGui.QStaticText, QtCore.QRect]]' = {}
+        self._ascent = self.fontMetrics().ascent()
+        self._value_cache = (None, None)
+        self._gradients: 'dict[tuple[int, bool], QtGui.QBrush]' = {}
+        self._pens: 'dict[tuple[QtGui.QPalette.ColorRole, int], QtGui.QPen]' = {}
+
+        # the ticks are rendered once into this strip, which is then just scrolled
+        self._strip = QtGui.QImage()
+        self._strip_key = None
+        self._strip_value = 0.
+        self._scratch = QtGui.QImage()
+        self._fade_mask = QtGui.QImage()
+        self._fade_mask_key = None
+
+        # setting the widths also creates the fixed geometry, which setValue
+        # needs even before the first resize
         self.setLineWidth(3)  # using lineWidth as the major tick width
         self.setMidLineWidth(5)  # using midLineWidth as the geometry width
         self.setPalette(self.darkPalette)
 
+    def _label(self, label: str) -> 'tuple[QtGui.QStaticText, QtCore.QRect]':
+        '''internal function : the (cached) laid out text of a label, and its tight bounding rect'''
+        try:
+            return self._labels[label]
+        except KeyError:
+            if len(self._labels) > 256:
+                self._labels.clear()
+            static = QtGui.QStaticText(label)
+            static.prepare(QtGui.QTransform(), self.font())
+            cached = self._labels[label] = (static, self.fontMetrics().tightBoundingRect(label))
+            return cached
+
+    def _value_label(self) -> 'tuple[QtGui.QStaticText, QtCore.QPoint, QtCore.QRect]':
+        '''internal function : the (cached) value text, where to draw it, and the area it covers'''
+        # 0. == -0., but they are not formatted the same
+        key = (self._value, math.copysign(1., self._value), self._value_formatstr)
+        if key != self._value_cache[0]:
+            value_static, value_rect = self._label(self._value_formatstr.format(self._value))
+            # the baseline point at which the value will be drawn
+            value_anchor = self.rect().center() + self._value_offset + \
+                QtCore.QPoint(self._value_shift[0]*value_rect.width(),
+                              self._value_shift[1]*value_rect.height())
+            # static text is positioned by its top left corner, not its baseline
+            self._value_cache = (key, (value_static,
+                                       value_anchor - QtCore.QPoint(0, self._ascent),
+                                       value_rect.translated(value_anchor)))
+        return self._value_cache[1]
+
+    def _tick_lines(self, positions: np.ndarray, extent: int, mid: int, length: int) -> QtGui.QPolygon:
+        '''internal function : pack ticks into point pairs, so they can be drawn with a single `drawLines`'''
+        pos = (positions * extent).astype(int)
+        polygon = QtGui.QPolygon(2*pos.size)
+        if not pos.size:
+            return polygon
+        # write the coordinates straight into the polygon's buffer
+        buffer = polygon.data()
+        buffer.setsize(4 * pos.size * np.dtype(np.intc).itemsize)
+        coords = np.frombuffer(buffer, dtype=np.intc).reshape(-1, 4)
+        if self._vertical:  # (mid, pos) -> (mid+length, pos)
+            coords[:, 0], coords[:, 2] = mid, mid+length
+            coords[:, 1] = coords[:, 3] = pos
+        else:  # (pos, mid) -> (pos, mid+length)
+            coords[:, 0] = coords[:, 2] = pos
+            coords[:, 1], coords[:, 3] = mid, mid+length
+        return polygon
+
+    def changeEvent(self, a0: QtCore.QEvent) -> None:
+        if a0.type() == QtCore.QEvent.Type.FontChange:
+            self._labels.clear()
+            self._ascent = self.fontMetrics().ascent()
+            self._value_cache = (None, None)
+        if a0.type() == QtCore.QEvent.Type.PaletteChange:
+            self._gradients.clear()
+            self._pens.clear()
+        if a0.type() in (QtCore.QEvent.Type.FontChange, QtCore.QEvent.Type.PaletteChange):
+            self._strip_key = None
+        return super().changeEvent(a0)
+
+    def _update_strip_cache(self):
+        '''
+        internal function : (re-)render the ticks and their labels into an off-screen strip.
+
+        the strip covers twice the displayed range, so that the tape can be scrolled
+        by up to half its range just by blitting the strip with an offset.
+        '''
+        length = self.height() if self._vertical else self.width()
+        margin = (self._hi - self._lo) / 2
+        key = (self.size(), self._alignment, self._inverted, self._lo, self._hi,
+               self._major_tick_interval, self._minor_tick_frequency, self._tick_formatstr,
+               self.lineWidth(), self.midLineWidth())
+        if key == self._strip_key and abs(self._value - self._strip_value) <= margin/2:
+            return
+
+        self._strip_key = key
+        self._strip_value = self._value
+        if self._vertical:
+            self._strip = QtGui.QImage(self.width(), 2*length, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        else:
+            self._strip = QtGui.QImage(2*length, self.height(), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        self._strip.fill(QtCore.Qt.GlobalColor.transparent)
+        if self._strip.isNull():
+            return
+
+        labels, major, minor = self._tick_arrays(margin)
+        line = self.palette().color(QtGui.QPalette.ColorRole.Foreground)
+        text = self.palette().color(QtGui.QPalette.ColorRole.BrightText)
+        extent = 2*length
+
+        with QtGui.QPainter(self._strip) as p:
+            p: QtGui.QPainter  # for typehinting
+            p.setFont(self.font())
+            mid, sign = self._tick_mid, self._tick_sign
+
+            # the tick lines
+            p.setPen(QtGui.QPen(line, self.lineWidth()))
+            p.drawLines(self._tick_lines(major, extent, mid, sign*self._major_tick_length))
+            p.setPen(QtGui.QPen(line, self._minor_tick_width))
+            p.drawLines(self._tick_lines(minor, extent, mid, sign*self._minor_tick_length))
+
+            # the labels
+            p.setPen(QtGui.QPen(text, self.lineWidth()))
+            if not self._vertical:
+                # the labels read upwards, along the tick lines
+                p.translate(0, 2*self.rect().center().y())
+                p.rotate(-90)
+            for label, position in zip(labels, (major*extent).astype(int).tolist()):
+                static, rect = self._label(label)
+                x = self._label_x - rect.width() if self._label_flush_right else self._label_x
+                # static text is positioned by its top left corner, not its baseline
+                p.drawStaticText(x, position + rect.height()//2 - self._ascent, static)
+
+    def _fade_strip(self, rect: QtCore.QRect) -> QtGui.QImage:
+        '''internal function : blit the visible part of the strip, faded out towards the ends of the tape.
+        only the area within `rect` is valid afterwards.'''
+        length = self.height() if self._vertical else self.width()
+
+        # how far the strip has to be moved to line up with the current value
+        shift = (self._value - self._strip_value) * length / (self._hi - self._lo)
+        offset = round(-length/2 + (-shift if self._inverted else shift))
+
+        if self._scratch.size() != self.size():
+            self._scratch = QtGui.QImage(self.size(), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        if self._fade_mask.size() != self.size() or self._fade_mask_key != self._alignment:
+            # bake the fade into a mask once, so it is not re-evaluated for every paint
+            self._fade_mask = QtGui.QImage(self.size(), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+            self._fade_mask_key = self._alignment
+            self._fade_mask.fill(QtCore.Qt.GlobalColor.transparent)
+            with QtGui.QPainter(self._fade_mask) as p:
+                p.fillRect(self._fade_mask.rect(), self._create_alpha_gradient(QtCore.Qt.GlobalColor.black))
+        with QtGui.QPainter(self._scratch) as p:
+            p: QtGui.QPainter  # for typehinting
+            p.setClipRect(rect)
+            # the strip always covers the whole widget, so there is no need to
+            # clear the scratch image first if it is just copied over it
+            p.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_Source)
+            p.drawImage(0, offset, self._strip) if self._vertical else p.drawImage(offset, 0, self._strip)
+            # only keep the alpha of the gradient
+            p.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_DestinationIn)
+            p.drawImage(rect, self._fade_mask, rect)
+        return self._scratch
+
     def minimumSizeHint(self) -> QtCore.QSize:
         '''minimum permissible size for this widget'''
         val_rect = self.fontMetrics().boundingRect(
@@ -202,50 +398,74 @@ class TapeIndicator(AbstractTapeIndicator):
             return QtCore.QSize(200, 2*val_rect.width()+self._major_tick_length)
 
     def _create_fixed_geometry(self):
-        '''internal function for creating fixed geometry - should be called only on resize or alignement change'''
+        '''internal function for creating fixed geometry - should be called only on resize, alignement or line width change'''
+        # the gradients depend on the geometry as well
+        self._gradients.clear()
+        self._pens.clear()
+
+        # plain int coordinates, rather than QPoints
+        left, top, right, bottom = 0, 0, self.width()-1, self.height()-1
+        cx, cy = right//2, bottom//2  # same as self.rect().center()
+
         # create the central slide/groove
         if self._alignment in (QtCore.Qt.AlignmentFlag.AlignRight, QtCore.Qt.AlignmentFlag.AlignLeft):
-            self._slide_line = [
-                QtCore.QPoint(self.width()//2, self.rect().top()),
-                QtCore.QPoint(self.width()//2, self.rect().bottom()),
-            ]
+            slide_line = (self.width()//2, top, self.width()//2, bottom)
         else:
-            self._slide_line = [
-                QtCore.QPoint(self.rect().left(), self.height()//2),
-                QtCore.QPoint(self.rect().right(), self.height()//2),
-            ]
+            slide_line = (left, self.height()//2, right, self.height()//2)
 
         # the lign which indicates the current value
         # requires a special case for each alignment
-        if self._alignment == QtCore.Qt.AlignmentFlag.AlignLeft:
-            self._indicator = [
-                self.rect().center() + QtCore.QPoint(+1, 0),  # avoid weird rounding errors
-                QtCore.QPoint(self.rect().right(),
-                              self.rect().center().y())
-            ]
-        elif self._alignment == QtCore.Qt.AlignmentFlag.AlignRight:
-            self._indicator = [
-                self.rect().center() + QtCore.QPoint(-1, 0),  # avoid weird rounding errors
-                QtCore.QPoint(self.rect().left(),
-                              self.rect().center().y())
-            ]
-        elif self._alignment == QtCore.Qt.AlignmentFlag.AlignTop:
-            self._indicator = [
-                self.rect().center() + QtCore.QPoint(0, +1),  # avoid weird rounding errors
-                QtCore.QPoint(self.rect().center().x(),
-                              self.rect().bottom())
-            ]
-        elif self._alignment == QtCore.Qt.AlignmentFlag.AlignBottom:
-            self._indicator = [
-                self.rect().center() + QtCore.QPoint(0, -1),  # avoid weird rounding errors
-                QtCore.QPoint(self.rect().center().x(),
-                              self.rect().top())
-            ]
+        # (the +-1 avoids weird rounding errors)
+        indicator = {
+            QtCore.Qt.AlignmentFlag.AlignLeft: (cx+1, cy, right, cy),
+            QtCore.Qt.AlignmentFlag.AlignRight: (cx-1, cy, left, cy),
+            QtCore.Qt.AlignmentFlag.AlignTop: (cx, cy+1, cx, bottom),
+            QtCore.Qt.AlignmentFlag.AlignBottom: (cx, cy-1, cx, top),
+        }[self._alignment]
+
+        # both lines as a single pair of points each, ready for `drawLines`
+        self._fixed_lines = QtGui.QPolygon(list(slide_line + indicator))
+
+        # the layout of the ticks and labels, which only depends on the alignment :
+        # which way the tape runs, where the ticks start and which way they point,
+        # where the labels start and whether they end there instead.
+        # the labels of horizontal tapes are rotated, so they are laid out along y.
+        self._vertical = self._alignment in (QtCore.Qt.AlignmentFlag.AlignRight, QtCore.Qt.AlignmentFlag.AlignLeft)
+        self._tick_sign = -1 if self._alignment in (QtCore.Qt.AlignmentFlag.AlignLeft,
+                                                    QtCore.Qt.AlignmentFlag.AlignTop) else +1
+        center = self.rect().center()
+        self._tick_mid = (center.x() if self._vertical else center.y()) + \
+            self._tick_sign*(self.midLineWidth()//2+1)
+        self._label_x, self._label_flush_right = {
+            QtCore.Qt.AlignmentFlag.AlignLeft: (self._tick_mid-7-self._major_tick_length, True),
+            QtCore.Qt.AlignmentFlag.AlignRight: (self._tick_mid+5+self._major_tick_length, False),
+            QtCore.Qt.AlignmentFlag.AlignTop: (center.y()+self.midLineWidth()//2+6+self._major_tick_length, False),
+            QtCore.Qt.AlignmentFlag.AlignBottom: (center.y()-self.midLineWidth()//2-8-self._major_tick_length, True),
+        }[self._alignment]
+        # the value is drawn next to the center, shifted by its own width or height
+        w = self.midLineWidth()
+        self._value_offset, self._value_shift = {
+            QtCore.Qt.AlignmentFlag.AlignLeft: (QtCore.QPoint(w, -w), (0, 0)),
+            QtCore.Qt.AlignmentFlag.AlignRight: (QtCore.QPoint(-w, -w), (-1, 0)),
+            QtCore.Qt.AlignmentFlag.AlignTop: (QtCore.QPoint(w, w), (0, 1)),
+            QtCore.Qt.AlignmentFlag.AlignBottom: (QtCore.QPoint(w, -w), (0, 0)),
+        }[self._alignment]
+
+        self._value_cache = (None, None)  # the value text has to be moved as well
+
+        # the area covered by the fixed geometry
+        self._fixed_bbox = self._fixed_lines.boundingRect()
 
     def _create_alpha_gradient(self,
                                color: typing.Union[QtCore.Qt.GlobalColor, QtGui.QColor],
-                               rotated: bool = False) -> QtGui.QLinearGradient:
-        '''internal function for creating the gradient map used to draw the widget'''
+                               rotated: bool = False) -> QtGui.QBrush:
+        '''internal function for creating the (cached) gradient brush used to draw the widget'''
+        color = QtGui.QColor(color)
+        try:
+            return self._gradients[(color.rgba(), rotated)]
+        except KeyError:
+            pass
+
         if self._alignment in (QtCore.Qt.AlignmentFlag.AlignRight, QtCore.Qt.AlignmentFlag.AlignLeft):
             if rotated:
                 gradient = QtGui.QLinearGradient(0, 0, self.height(), 0)
@@ -265,13 +485,58 @@ class TapeIndicator(AbstractTapeIndicator):
                             color)
         gradient.setColorAt(0.99,
                             QtCore.Qt.GlobalColor.transparent)
-        return gradient
+        brush = self._gradients[(color.rgba(), rotated)] = QtGui.QBrush(gradient)
+        return brush
+
+    def _gradient_pen(self, role: QtGui.QPalette.ColorRole, width: int) -> QtGui.QPen:
+        '''internal function : the (cached) pen for drawing in the given palette color, with the alpha gradient'''
+        try:
+            return self._pens[(role, width)]
+        except KeyError:
+            pen = self._pens[(role, width)] = QtGui.QPen(
+                self._create_alpha_gradient(self.palette().color(role)), width)
+            return pen
 
     def setAlignment(self, alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignLeft):
         '''Set the alignment of the widget. Only `right`, `left`, `top` and `bottom` are allowed.'''
         super().setAlignment(alignment)
         self._create_fixed_geometry()
 
+    def setLineWidth(self, width: int):
+        '''Set the width of the major tick marks.'''
+        super().setLineWidth(width)
+        self._create_fixed_geometry()
+        self.update()
+
+    def setMidLineWidth(self, width: int):
+        '''Set the width of the geometry, i.e. the slide and the value indicator.'''
+        super().setMidLineWidth(width)
+        self._create_fixed_geometry()
+        self.update()
+
+    def setValue(self, value: float, formatstr: str = None):
+        '''set the value to display - only the moving parts of the tape are repainted'''
+        if formatstr is not None:
+            return super().setValue(value, formatstr)
+        if self._isCurrentValue(value):
+            return  # nothing to redraw
+        old_bbox = self._value_label()[2]
+        self._value = float(value)
+        self.update(self._tape_band().united(old_bbox).united(self._value_label()[2]))
+
+    def _tape_band(self) -> QtCore.QRect:
+        '''internal function : the area covered by the ticks and their labels, i.e. what moves with the value'''
+        # the ticks and labels are all on one side of the center,
+        # give or take the width of the tick lines
+        w = self.lineWidth()
+        if self._tick_sign < 0:
+            lo, hi = 0, self._tick_mid + w
+        else:
+            lo, hi = self._tick_mid - w, self.width() if self._vertical else self.height()
+        if self._vertical:
+            return QtCore.QRect(lo, 0, hi-lo, self.height())
+        return QtCore.QRect(0, lo, self.width(), hi-lo)
+
     def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
         super().resizeEvent(a0)
         self._create_fixed_geometry()
@@ -281,123 +546,30 @@ class TapeIndicator(AbstractTapeIndicator):
         '''draws the widget'''
         # super().paintEvent(a0) #we don't paint the QFrame rect !
 
-        text = self._create_alpha_gradient(
-            self.palette().color(QtGui.QPalette.ColorRole.BrightText))
-        line = self._create_alpha_gradient(
-            self.palette().color(QtGui.QPalette.ColorRole.Foreground))
+        if a0.region().isEmpty():
+            return
 
         # create the painter
         with QtGui.QPainter(self) as p:
             p: QtGui.QPainter  # for typehinting
-            p.setPen(QtGui.QPen(line, self.midLineWidth()))
-
-            # draw the fixed geometry
-            p.drawLine(*self._slide_line)
-            p.drawLine(*self._indicator)
-
-            # get the value text and its metrics
-            value_text = self._value_formatstr.format(self._value)
-            value_rect = self.fontMetrics().tightBoundingRect(value_text)
-            # the point at which the value will be drawn
-            if self._alignment == QtCore.Qt.AlignmentFlag.AlignLeft:
-                value_anchor = self.rect().center() + \
-                    QtCore.QPoint(self.midLineWidth(),
-                                  -self.midLineWidth())
-            elif self._alignment == QtCore.Qt.AlignmentFlag.AlignRight:
-                value_anchor = self.rect().center() + \
-                    QtCore.QPoint(-self.midLineWidth() - value_rect.width(),
-                                  -self.midLineWidth())
-            elif self._alignment == QtCore.Qt.AlignmentFlag.AlignTop:
-                value_anchor = self.rect().center() + \
-                    QtCore.QPoint(self.midLineWidth(),
-                                  self.midLineWidth()+value_rect.height())
-            elif self._alignment == QtCore.Qt.AlignmentFlag.AlignBottom:
-                value_anchor = self.rect().center() + \
-                    QtCore.QPoint(self.midLineWidth(),
-                                  -self.midLineWidth())
+            p.setClipRegion(a0.region())
+
+            # draw the fixed geometry, if it needs repainting
+            w = self.midLineWidth()
+            if a0.region().intersects(self._fixed_bbox.adjusted(-w, -w, w, w)):
+                p.setPen(self._gradient_pen(QtGui.QPalette.ColorRole.Foreground, w))
+                p.drawLines(self._fixed_lines)
+
             # draw the value text
-            p.setPen(QtGui.QPen(text, self.lineWidth()))
-            p.drawText(value_anchor, value_text)
+            value_static, value_pos, value_bbox = self._value_label()
+            if a0.region().intersects(value_bbox):
+                p.setPen(self._gradient_pen(QtGui.QPalette.ColorRole.BrightText, self.lineWidth()))
+                p.drawStaticText(value_pos, value_static)
 
-            # draw the ticks
-            p.setPen(QtGui.QPen(line, self.lineWidth()))
-            major, minor = self._generate_ticks()
-            if self._alignment == QtCore.Qt.AlignmentFlag.AlignLeft:
-                mid = self.rect().center().x() - self.midLineWidth()//2-1
-                for _, position in major:
-                    p.drawLine(mid, position*self.height(),
-                               mid-self._major_tick_length, position*self.height())
-                p.setPen(QtGui.QPen(text, self.lineWidth()))
-                for label, position in major:
-                    rect = self.fontMetrics().tightBoundingRect(label)
-                    p.drawText(mid-7-self._major_tick_length-rect.width(),
-                               position*self.height() + rect.height()//2,
-                               label)
-                p.setPen(QtGui.QPen(line, self._minor_tick_width))
-                for position in minor:
-                    p.drawLine(mid, position*self.height(),
-                               mid-self._minor_tick_length, position*self.height())
-            elif self._alignment == QtCore.Qt.AlignmentFlag.AlignRight:
-                mid = self.rect().center().x() + self.midLineWidth()//2+1
-                for label, position in major:
-                    p.drawLine(mid, position*self.height(),
-                               mid+self._major_tick_length, position*self.height())
-                p.setPen(QtGui.QPen(text, self.lineWidth()))
-                for label, position in major:
-                    rect = self.fontMetrics().tightBoundingRect(label)
-                    p.drawText(mid+5+self._major_tick_length,
-                               position*self.height() + rect.height()//2,
-                               label)
-                p.setPen(QtGui.QPen(line, self._minor_tick_width))
-                for position in minor:
-                    p.drawLine(mid, position*self.height(),
-                               mid+self._minor_tick_length, position*self.height())
-            elif self._alignment == QtCore.Qt.AlignmentFlag.AlignTop:
-                mid = self.rect().center().y() - self.midLineWidth()//2-1
-                text_rotated = self._create_alpha_gradient(
-                    self.palette().color(QtGui.QPalette.ColorRole.BrightText), True)
-                for _, position in major:
-                    p.drawLine(position*self.width(), mid,
-                               position*self.width(), mid-self._major_tick_length)
-                p.save()
-                p.setPen(QtGui.QPen(line, self._minor_tick_width))
-                for position in minor:
-                    p.drawLine(position*self.width(), mid,
-                               position*self.width(), mid-self._minor_tick_length)
-                p.translate(self.rect().center())
-                p.rotate(-90)
-                p.translate(-self.rect().center().y(),
-                            -self.rect().center().x())
-                p.setPen(QtGui.QPen(text_rotated, self.lineWidth()))
-                for label, position in major:
-                    rect = self.fontMetrics().tightBoundingRect(label)
-                    p.drawText(self.rect().center().y()+self.midLineWidth()//2+6+self._major_tick_length,
-                               position*self.width()+rect.height()//2,
-                               label)
-                p.restore()
-            elif self._alignment == QtCore.Qt.AlignmentFlag.AlignBottom:
-                mid = self.rect().center().y() + self.midLineWidth()//2+1
-                text_rotated = self._create_alpha_gradient(
-                    self.palette().color(QtGui.QPalette.ColorRole.BrightText), True)
-                for _, position in major:
-                    p.drawLine(position*self.width(), mid,
-                               position*self.width(), mid+self._major_tick_length)
-                p.setPen(QtGui.QPen(line, self._minor_tick_width))
-                for position in minor:
-                    p.drawLine(position*self.width(), mid,
-                               position*self.width(), mid+self._minor_tick_length)
-                p.save()
-                p.translate(self.rect().center())
-                p.rotate(-90)
-                p.translate(-self.rect().center().y(),
-                            -self.rect().center().x())
-                p.setPen(QtGui.QPen(text_rotated, self.lineWidth()))
-                for label, position in major:
-                    rect = self.fontMetrics().tightBoundingRect(label)
-                    p.drawText(self.rect().center().y()-self.midLineWidth()//2-8-self._major_tick_length-rect.width(),
-                               position*self.width()+rect.height()//2,
-                               label)
-                p.restore()
+            # draw the (pre-rendered) ticks, faded out towards the ends of the tape
+            self._update_strip_cache()
+            r = a0.rect()
+            p.drawImage(r, self._fade_strip(r), r)
 
         a0.accept()
 
@@ -409,8 +581,16 @@ class TapeTestWidget(QtWidgets.QWidget):
         testWidget.setValue(3, '{:.2f}m')
         testWidget.setTickInterval(.2, '{:.1f}m')
 
+        # the slider can fire many times per frame when dragged,
+        # so only pass on the latest value, at most ~60 times per second
+        self._pending = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(16)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(lambda: testWidget.setValue(self._pending/50 + 3))
+
         slider = QtWidgets.QSlider(QtCore.Qt.Orientation.Vertical, self)
-        slider.valueChanged.connect(lambda v: testWidget.setValue(v/50 + 3))
+        slider.valueChanged.connect(self._sliderMoved)
 
         group = QtWidgets.QGroupBox("Alignment", self)
         group.setLayout(QtWidgets.QVBoxLayout())
@@ -434,3 +614,9 @@ class TapeTestWidget(QtWidgets.QWidget):
         self.layout().addWidget(group)
         self.layout().addWidget(slider)
         self.layout().addWidget(testWidget)
+
+    def _sliderMoved(self, value: int):
+        '''internal function : remember the slider value, and schedule passing it on'''
+        self._pending = value
+        if not self._timer.isActive():
+            self._timer.start()
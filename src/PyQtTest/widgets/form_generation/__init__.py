@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+'''
+A module for generating forms from JSON or YAML files
+
+Author  :   Michael Biselx
+Date    :   11.2022
+Project :   PyQtTest
+'''
+
+from .form_generation import FormDisplay, ListDisplay
@@ -12,13 +12,126 @@ __all__ = [
     'ListDisplay'
 ]
 
+import os
 import json
 import yaml
 import typing
 import logging
+import functools
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
+try:  # use the (much faster) libyaml bindings, if available
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_prototype(filename: str, mtime: int, size: int) -> 'dict[str, typing.Any]':
+    '''parse a form prototype from a JSON or YAML file. `mtime` and `size` only serve as the cache key'''
+    with open(filename) as f:
+        if filename.lower().endswith('json'):
+            return json.load(f)
+        elif filename.lower().endswith(('yaml', 'yml')):
+            return yaml.load(f, Loader=SafeLoader)
+    raise ValueError(f"Filetype `{filename}` not supported")
+
+
+def _load_prototype(filename: str) -> 'dict[str, typing.Any]':
+    '''
+    load a form prototype from a file, only parsing it again if the file has changed since.
+
+    the prototype is shared between all the forms loaded from the same file, so it must not be modified.
+    '''
+    stat = os.stat(filename)
+    return _parse_prototype(os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+
+
+def _string_field(parent: QtWidgets.QWidget, protofield: 'dict[str, typing.Any]') -> QtWidgets.QWidget:
+    w = QtWidgets.QLineEdit(parent)
+    w.setText(str(protofield.get('value', '')))
+    w.getValue = w.text
+    return w
+
+
+def _integer_field(parent: QtWidgets.QWidget, protofield: 'dict[str, typing.Any]') -> QtWidgets.QWidget:
+    w = QtWidgets.QSpinBox(parent)
+    w.setMinimum(int(protofield.get('minimum', 0)))
+    w.setMaximum(int(protofield.get('maximum', 99)))
+    w.setValue(int(protofield.get('value', 0)))
+    w.getValue = w.value
+    return w
+
+
+def _decimal_field(parent: QtWidgets.QWidget, protofield: 'dict[str, typing.Any]') -> QtWidgets.QWidget:
+    w = QtWidgets.QDoubleSpinBox(parent)
+    w.setMinimum(float(protofield.get('minimum', 0)))
+    w.setMaximum(float(protofield.get('maximum', 99)))
+    w.setValue(float(protofield.get('value', 0)))
+    w.setDecimals(int(protofield.get('precision', 2)))
+    w.getValue = w.value
+    return w
+
+
+def _date_field(parent: QtWidgets.QWidget, protofield: 'dict[str, typing.Any]') -> QtWidgets.QWidget:
+    w = QtWidgets.QDateEdit(parent)
+    w.setCalendarPopup(True)
+    w.getValue = lambda: w.date().toString(QtCore.Qt.DateFormat.ISODate)
+    value = str(protofield.get('value', 'today'))
+
+    if value.lower() != 'today':
+        try:
+            w.setDate(QtCore.QDate.fromString(
+                value,
+                QtCore.Qt.DateFormat.ISODate))
+        except Exception as e:
+            logging.error(
+                f"could not parse {value} as a date")
+            logging.exception(e)
+    else:
+        w.setDate(QtCore.QDate.currentDate())
+    return w
+
+
+def _choice_field(parent: QtWidgets.QWidget, protofield: 'dict[str, typing.Any]') -> QtWidgets.QWidget:
+    if protofield.get('exclusive', True):
+        w = QtWidgets.QComboBox(parent)
+        w.setEditable(bool(protofield.get('open', False)))
+        w.addItems(map(str, protofield.get('choices', [])))
+        if 'value' in protofield:
+            w.setCurrentText(str(protofield.get('value')))
+        w.getValue = w.currentText
+    else:
+        w = QtWidgets.QWidget(parent)
+        w.setLayout(QtWidgets.QHBoxLayout(w))
+        w.buttonGroup = QtWidgets.QButtonGroup(w)
+        w.buttonGroup.setExclusive(False)
+        values = protofield.get('value', [])
+        if not isinstance(values, list):
+            values = [values]
+        values = map(str, values)
+        for choice in map(str, protofield.get('choices', [])):
+            cb = QtWidgets.QCheckBox(choice)
+            w.layout().addWidget(cb)
+            w.buttonGroup.addButton(cb)
+            if choice in values:
+                cb.setChecked(True)
+
+        w.getValue = lambda: [
+            b.text() for b in w.buttonGroup.buttons() if b.isChecked()]
+    return w
+
+
+# the input widget builders, by field type
+_FIELD_BUILDERS: 'dict[str, typing.Callable[[QtWidgets.QWidget, dict[str, typing.Any]], QtWidgets.QWidget]]' = {
+    'string': _string_field,
+    'integer': _integer_field,
+    'decimal': _decimal_field,
+    'date': _date_field,
+    'choice': _choice_field,
+}
+
 
 class FormDisplay(QtWidgets.QFrame):
     def __init__(self,
@@ -27,7 +140,7 @@ class FormDisplay(QtWidgets.QFrame):
                  form: typing.Optional[str] = None) -> None:
         super().__init__(parent, flags)
 
-        self.form = QtWidgets.QFormLayout()
+        self._form = QtWidgets.QFormLayout()
 
         export_button = QtWidgets.QPushButton('export', self)
         export_button.setIcon(self.style().standardIcon(
@@ -35,26 +148,59 @@ class FormDisplay(QtWidgets.QFrame):
         export_button.clicked.connect(self.export_callback)
 
         self.setLayout(QtWidgets.QVBoxLayout(self))
-        self.layout().addLayout(self.form)
+        self.layout().addLayout(self._form)
         self.layout().addWidget(export_button)
 
+        # the form widgets are only built once they are needed (see _buildPending)
+        self._pending_prototypes: 'list[dict[str, typing.Any]]' = []
+
         if form is not None:
             self.fromFile(form)
 
     def fromFile(self, filename: str):
-        '''read the form structure from a dict'''
-        with open(filename) as f:
-            if filename.lower().endswith('json'):
-                prototype: 'dict[str, dict]' = json.load(f)
-            elif filename.lower().endswith(('yaml', 'yml')):
-                prototype: 'dict[str, dict]' = yaml.safe_load(f)
-        self.formFromPrototype(prototype)
+        '''
+        read the form structure from a file.
+        the widgets are only built when the form is first shown or read
+        '''
+        self._pending_prototypes.append(_load_prototype(filename))
+        if self.isVisible():
+            self._buildPending()
+
+    def _buildPending(self):
+        '''internal function : build the widgets of the forms which were loaded but not built yet, in order'''
+        while self._pending_prototypes:
+            self._addRows(self._pending_prototypes.pop(0))
+
+    @property
+    def form(self) -> QtWidgets.QFormLayout:
+        '''the layout holding the form rows (any pending rows are built first)'''
+        self._buildPending()
+        return self._form
+
+    def event(self, a0: QtCore.QEvent) -> bool:
+        # polishing happens right before the first show, and before the initial size is computed.
+        # it only happens once though, so forms loaded while hidden are built on the next show
+        if a0.type() in (QtCore.QEvent.Type.Polish, QtCore.QEvent.Type.Show):
+            self._buildPending()
+        return super().event(a0)
 
     def formFromPrototype(self, prototype: 'dict[str, typing.Any]'):
-        for key, value in prototype.items():
-            if key.lower() == 'fields':
-                for protofield in value:
-                    self.form.addRow(*self.formitemFromProtofield(protofield))
+        # the rows of forms loaded earlier come first
+        self._buildPending()
+        self._addRows(prototype)
+
+    def _addRows(self, prototype: 'dict[str, typing.Any]'):
+        '''internal function : add the rows described by the prototype to the form'''
+        # don't repaint or re-layout for every single row
+        self.setUpdatesEnabled(False)
+        try:
+            for key, value in prototype.items():
+                if key.lower() == 'fields':
+                    for protofield in value:
+                        self._form.addRow(*self.formitemFromProtofield(protofield))
+            self._form.activate()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def formitemFromProtofield(self, protofield: 'dict[str, dict]'):
         # get the obligatory fields :
@@ -69,70 +215,9 @@ class FormDisplay(QtWidgets.QFrame):
             return field_name, w
 
         # make the input widget according to the field
-        if field_type == 'string':
-            w = QtWidgets.QLineEdit(self)
-            w.setText(str(protofield.get('value', '')))
-            w.getValue = w.text
-
-        elif field_type == 'integer':
-            w = QtWidgets.QSpinBox(self)
-            w.setMinimum(int(protofield.get('minimum', 0)))
-            w.setMaximum(int(protofield.get('maximum', 99)))
-            w.setValue(int(protofield.get('value', 0)))
-            w.getValue = w.value
-
-        elif field_type == 'decimal':
-            w = QtWidgets.QDoubleSpinBox(self)
-            w.setMinimum(float(protofield.get('minimum', 0)))
-            w.setMaximum(float(protofield.get('maximum', 99)))
-            w.setValue(float(protofield.get('value', 0)))
-            w.setDecimals(int(protofield.get('precision', 2)))
-            w.getValue = w.value
-
-        elif field_type == 'date':
-            w = QtWidgets.QDateEdit(self)
-            w.setCalendarPopup(True)
-            w.getValue = lambda: w.date().toString(QtCore.Qt.DateFormat.ISODate)
-            value = str(protofield.get('value', 'today'))
-
-            if value.lower() != 'today':
-                try:
-                    w.setDate(QtCore.QDate.fromString(
-                        value,
-                        QtCore.Qt.DateFormat.ISODate))
-                except Exception as e:
-                    logging.error(
-                        f"could not parse {value} as a date")
-                    logging.exception(e)
-            else:
-                w.setDate(QtCore.QDate.currentDate())
-
-        elif field_type == 'choice':
-            if protofield.get('exclusive', True):
-                w = QtWidgets.QComboBox(self)
-                w.setEditable(bool(protofield.get('open', False)))
-                w.addItems(map(str, protofield.get('choices', [])))
-                if 'value' in protofield:
-                    w.setCurrentText(str(protofield.get('value')))
-                w.getValue = w.currentText
-            else:
-                w = QtWidgets.QWidget(self)
-                w.setLayout(QtWidgets.QHBoxLayout(w))
-                w.buttonGroup = QtWidgets.QButtonGroup(w)
-                w.buttonGroup.setExclusive(False)
-                values = protofield.get('value', [])
-                if not isinstance(values, list):
-                    values = [values]
-                values = map(str, values)
-                for choice in map(str, protofield.get('choices', [])):
-                    cb = QtWidgets.QCheckBox(choice)
-                    w.layout().addWidget(cb)
-                    w.buttonGroup.addButton(cb)
-                    if choice in values:
-                        cb.setChecked(True)
-
-                w.getValue = lambda: [
-                    b.text() for b in w.buttonGroup.buttons() if b.isChecked()]
+        builder = _FIELD_BUILDERS.get(field_type)
+        if builder is not None:
+            w = builder(self, protofield)
         else:
             logging.error(
                 f"No widget has been implemented for type '{field_type}'")
@@ -148,7 +233,7 @@ class FormDisplay(QtWidgets.QFrame):
         formitem_dict = self.toDict()
 
         if filename.endswith('yaml'):
-            dumper = yaml.safe_dump
+            dumper = functools.partial(yaml.dump, Dumper=SafeDumper)
         elif filename.endswith('json'):
             dumper = json.dump
         else:
@@ -210,12 +295,13 @@ class ListDisplay(QtWidgets.QFrame):
 
     def fromFile(self, filename: str):
         '''read the form structure from a dict'''
-        with open(filename) as f:
-            if filename.lower().endswith('json'):
-                prototype: 'dict[str, dict]' = json.load(f)
-            elif filename.lower().endswith(('yaml', 'yml')):
-                prototype: 'dict[str, dict]' = yaml.safe_load(f)
-        self._fromPrototype(prototype)
+        # don't repaint or re-layout for every single row
+        self.setUpdatesEnabled(False)
+        try:
+            self._fromPrototype(_load_prototype(filename))
+            self.form.activate()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _fromPrototype(self, prototype: 'dict[str, typing.Any]', *, layout=None) -> QtWidgets.QWidget:
         if layout is None:
@@ -271,17 +357,8 @@ class ListDisplay(QtWidgets.QFrame):
         name = prototype.get('name', '')
         dtype = str(prototype['type']).lower()
 
-        if dtype == 'string':
-            w = QtWidgets.QLineEdit()
-            w.setText(str(prototype.get('value', '')))
-
-        elif dtype == 'integer':
-            w = QtWidgets.QSpinBox()
-            w.setMinimum(int(prototype.get('minimum', 0)))
-            w.setMaximum(int(prototype.get('maximum', 99)))
-            w.setValue(int(prototype.get('value', 0)))
-
-        else:
+        if dtype not in _FIELD_BUILDERS:
             raise NotImplementedError(f"{dtype}")
+        w = _FIELD_BUILDERS[dtype](self, prototype)
 
         return name, w
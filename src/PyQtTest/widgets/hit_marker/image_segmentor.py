@@ -14,9 +14,11 @@ __all__ = [
     'ClickableSegmentImage'
 ]
 
-import pickle
+import os
+import json
 import cv2
 import typing
+import functools
 import numpy as np
 
 from PyQt5 import QtCore, QtGui, QtWidgets
@@ -29,6 +31,19 @@ except (ImportError, ValueError):  # for the demo
     from PyQtTest.resources import image_label_folder, get_path_to_img
 
 
+def _connected_components(img_b: np.ndarray) -> 'tuple[int, np.ndarray]':
+    '''
+    internal function : label the connected components of a binary image.
+
+    16 bit labels are faster, and enough for all but the noisiest images :
+    only fall back to 32 bit labels if there are too many segments.
+    '''
+    try:
+        return cv2.connectedComponents(img_b, ltype=cv2.CV_16U)
+    except cv2.error:
+        return cv2.connectedComponents(img_b, ltype=cv2.CV_32S)
+
+
 def segment_image(img: np.ndarray = None,
                   img_path: str = None,
                   outline_img: bool = False) -> 'tuple[int, np.ndarray]':
@@ -49,20 +64,21 @@ def segment_image(img: np.ndarray = None,
         if img_path is None:
             raise RuntimeError("Either an image or a path must be specified")
         else:
-            img = cv2.imread(img_path)
-
-    # get image in grayscale
-    img_g = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+            # decode straight to grayscale
+            img_g = cv2.imread(img_path, cv2.IMREAD_GRAYSCALE)
+    else:
+        # get image in grayscale
+        img_g = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
 
-    # binarize
+    # binarize - area images are dark on bright, so invert them right away
     _, img_b = cv2.threshold(img_g, 0, 255,
-                             cv2.THRESH_BINARY+cv2.THRESH_OTSU)
+                             (cv2.THRESH_BINARY if outline_img else cv2.THRESH_BINARY_INV)+cv2.THRESH_OTSU)
 
     # segment
     if not outline_img:
-        return cv2.connectedComponents(~img_b, ltype=cv2.CV_16U)
+        return _connected_components(img_b)
     else:
-        n_lbls, labels = cv2.connectedComponents(img_b, ltype=cv2.CV_16U)
+        n_lbls, labels = _connected_components(img_b)
         # set the background labels to 0 (assumption: the first area
         # returned after the outline is the background):
         labels[labels > 0] -= 1
@@ -70,23 +86,72 @@ def segment_image(img: np.ndarray = None,
         return n_lbls, labels
 
 
-def color_image_by_segments(labels: np.ndarray, color_dict: 'dict[int, colors.ColorRGBA]') -> np.ndarray:
+def color_image_by_segments(labels: np.ndarray,
+                            color_dict: 'dict[int, colors.ColorRGBA] | np.ndarray') -> np.ndarray:
     '''
     colors an image based on given labels
 
     @parameters :
     * `labels`: the labeled image
-    * `color_dict` : a dictionary containing the colors by label
+    * `color_dict` : a dictionary containing the colors by label, or directly
+            a `(n_lbls, 4)` uint8 array of the colors, indexed by label
 
     @returns :
     * `img` : the colorized image
     '''
-    img = np.zeros((*labels.shape, 4), dtype=np.uint8)
+    if isinstance(color_dict, dict):
+        # labels without a color stay transparent
+        lut = np.zeros((max(int(labels.max()), *color_dict) + 1, 4), dtype=np.uint8)
+        for label, color in color_dict.items():
+            lut[label] = color
+    else:
+        lut = color_dict
+
+    # a single lookup for the whole image, rather than one pass per label.
+    # each color is gathered as one 32 bit word, rather than as 4 separate bytes
+    words = np.ascontiguousarray(lut, dtype=np.uint8).view(np.uint32).ravel()
+    return words[labels].view(np.uint8).reshape(*labels.shape, 4)
+
+
+@functools.lru_cache(maxsize=4)
+def _segment_file(img_path: str, mtime: int, size: int, outline_img: bool) -> 'tuple[int, np.ndarray, list[np.ndarray]]':
+    '''
+    internal function : segment an image file. `mtime` and `size` only serve as the cache key
+
+    @returns :
+    * `(nb_lbls, labels, pixels)` : as for `segment_image`, as well as
+            the (flat) indices of the pixels of each segment
+    '''
+    n_lbls, labels = segment_image(img_path=img_path, outline_img=outline_img)
+    order = np.argsort(labels, axis=None, kind='stable')
+    sizes = np.bincount(labels.ravel(), minlength=n_lbls)
+    # these are shared by all the widgets showing the same image
+    labels.setflags(write=False)
+    order.setflags(write=False)
+    return n_lbls, labels, np.split(order, np.cumsum(sizes)[:-1])
+
+
+def _load_segments(img_path: str, outline_img: bool = False) -> 'tuple[int, np.ndarray, list[np.ndarray]]':
+    '''
+    internal function : segment an image file, only doing it again if the file has changed since.
+
+    the results are shared between all the widgets showing the same image, so they must not be modified.
+    '''
+    stat = os.stat(img_path)
+    return _segment_file(os.path.abspath(img_path), stat.st_mtime_ns, stat.st_size, bool(outline_img))
 
-    for label, color in color_dict.items():
-        img[np.where(labels == label)] = color
 
-    return img
+class _InstantToolTipStyle(QtWidgets.QProxyStyle):
+    '''a stye which shows the tool tip without delay'''
+
+    def styleHint(self, hint: QtWidgets.QStyle.StyleHint,
+                  option: typing.Optional[QtWidgets.QStyleOption] = None,
+                  widget: typing.Optional[QtWidgets.QWidget] = None,
+                  returnData: typing.Optional[QtWidgets.QStyleHintReturn] = None) -> int:
+        if hint == QtWidgets.QStyle.StyleHint.SH_ToolTip_WakeUpDelay:
+            return 0
+        else:
+            return super().styleHint(hint, option, widget, returnData)
 
 
 class SegmentImage(QtWidgets.QLabel):
@@ -119,29 +184,24 @@ class SegmentImage(QtWidgets.QLabel):
         self.setCursor(QtCore.Qt.CursorShape.CrossCursor)
         self.setMouseTracking(True)
 
-        class InstantToolTipSyle(QtWidgets.QProxyStyle):
-            '''a stye which shows the tool tip without delay'''
-
-            def styleHint(self, hint: QtWidgets.QStyle.StyleHint,
-                          option: typing.Optional[QtWidgets.QStyleOption] = None,
-                          widget: typing.Optional[QtWidgets.QWidget] = None,
-                          returnData: typing.Optional[QtWidgets.QStyleHintReturn] = None) -> int:
-                if hint == QtWidgets.QStyle.StyleHint.SH_ToolTip_WakeUpDelay:
-                    return 0
-                else:
-                    return super().styleHint(hint, option, widget, returnData)
-
-        self.setStyle(InstantToolTipSyle(self.style()))
+        self.setStyle(_InstantToolTipStyle(self.style()))
+        self._tooltip = ''
+        self._hover_label = -1  # label under the mouse at the last move
 
         if img_path:
             self.setImage(img=img_path, outline_img=outline_img)
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:
         '''track the mouse to display relevant tool tip'''
-        lbl = self.labels[round(event.localPos().y()),
-                          round(event.localPos().x())]
-        # don't show tooltip for background
-        self.setToolTip(self._segment_names[lbl] if lbl != 0 else '')
+        pos = event.pos()
+        lbl = self._labels_view[pos.y(), pos.x()]
+        if lbl != self._hover_label:  # most moves stay within the same segment
+            self._hover_label = lbl
+            # don't show tooltip for background
+            tooltip = self._segment_names[lbl] if lbl != 0 else ''
+            if tooltip != self._tooltip:
+                self._tooltip = tooltip
+                self.setToolTip(tooltip)
         # don't pass the event on
         event.accept()
 
@@ -157,19 +217,32 @@ class SegmentImage(QtWidgets.QLabel):
         '''
 
         if isinstance(img, str):
-            self.n_lbls, self.labels = segment_image(img_path=img,
-                                                     outline_img=outline_img)
+            self.n_lbls, self.labels, self._segment_pixels = _load_segments(img, outline_img)
+            # plain memoryview indexing is much cheaper than numpy scalar indexing,
+            # which matters for the mouse events
+            self._labels_view = memoryview(np.ascontiguousarray(self.labels))
 
             # create the tooltip segment names
             self._segment_names = dict(
                 zip(range(self.n_lbls), map(str, range(self.n_lbls))))
+            self._hover_label = -1
 
-            self.colorLabels = dict([(0, self._palette[None])] +
-                                    [(l, self._palette[False]) for l in range(1, self.n_lbls)])
+            # the color of each label, indexed by label
+            self.colorLabels = np.empty((self.n_lbls, 4), dtype=np.uint8)
+            self.colorLabels[0] = self._palette[None]
+            self.colorLabels[1:] = self._palette[False]
             img = color_image_by_segments(self.labels, self.colorLabels)
 
+            # the image is only ever colored once : segments whose color changes
+            # afterwards are painted over it (see paintEvent)
+            self._base_colors = self.colorLabels.copy()
+            self._segment_regions: 'dict[int, QtGui.QRegion]' = {}
+
+        # the QImage only wraps the array's buffer (the pixmap then copies it),
+        # so make sure it is laid out the way the QImage expects
+        img = np.ascontiguousarray(img, dtype=np.uint8)
         pxmp = QtGui.QPixmap.fromImage(
-            QtGui.QImage(img, img.shape[1], img.shape[0],
+            QtGui.QImage(img.data, img.shape[1], img.shape[0], img.strides[0],
                          QtGui.QImage.Format.Format_RGBA8888)
         )
         self.setPixmap(pxmp)
@@ -183,6 +256,7 @@ class SegmentImage(QtWidgets.QLabel):
         * `name`    :   the name attributed to the segment label
         '''
         self._segment_names[label] = name
+        self._hover_label = -1  # refresh the tooltip on the next move
 
     def setLabelNames(self, names: 'list[str]'):
         '''
@@ -193,6 +267,7 @@ class SegmentImage(QtWidgets.QLabel):
         '''
         for lbl, name in enumerate(names):
             self._segment_names[lbl] = name
+        self._hover_label = -1
 
     def setOnlySegmentActive(self, label: int):
         '''
@@ -201,10 +276,15 @@ class SegmentImage(QtWidgets.QLabel):
         @parameters :
         * `label`    :  the label of the region to activate
         '''
-        self.colorLabels = dict([(0, self._palette[None])] +
-                                [(l, self._palette[l == label]) for l in range(1, self.n_lbls)])
-        img = color_image_by_segments(self.labels, self.colorLabels)
-        self.setImage(img)
+        colors = np.empty_like(self.colorLabels)
+        colors[0] = self.colorLabels[0]
+        colors[1:] = self._palette[False]
+        if label != 0:  # the background stays transparent
+            colors[label] = self._palette[True]
+        if np.array_equal(colors, self.colorLabels):
+            return  # e.g. clicking the active segment again
+        self.colorLabels[:] = colors
+        self.update()
 
     def updateSegentActive(self, label: int, active: bool = True):
         '''
@@ -214,19 +294,155 @@ class SegmentImage(QtWidgets.QLabel):
         * `label`    :  the label of the segment to activate/deactivate        
         * `active`   :  if the region should be set as active or not
         '''
+        if self.colorLabels[label].tolist() == list(self._palette[active]):
+            return  # nothing changes
         self.colorLabels[label] = self._palette[active]
-        img = color_image_by_segments(self.labels, self.colorLabels)
-        self.setImage(img)
+        self.update()
+
+    def _segmentRegion(self, label: int) -> QtGui.QRegion:
+        '''
+        internal function : the (cached) region covered by a segment
+
+        @parameters :
+        * `label`    :  the label of the segment
+        '''
+        try:
+            return self._segment_regions[label]
+        except KeyError:
+            pixels = self._segment_pixels[label]
+            if not pixels.size:
+                region = self._segment_regions[label] = QtGui.QRegion()
+                return region
+
+            # only build the mask over the bounding box of the segment
+            ys, xs = np.divmod(pixels, self.labels.shape[1])
+            top, left = int(ys.min()), int(xs.min())
+            mask = np.zeros((int(ys.max())-top+1, int(xs.max())-left+1), dtype=bool)
+            mask[ys-top, xs-left] = True
+
+            bits = np.packbits(mask, axis=1)
+            mono = QtGui.QImage(bits.data, bits.shape[1]*8, bits.shape[0], bits.strides[0],
+                                QtGui.QImage.Format.Format_Mono).copy(0, 0, mask.shape[1], mask.shape[0])
+            mono.setColorTable([QtGui.qRgb(255, 255, 255), QtGui.qRgb(0, 0, 0)])
+            region = self._segment_regions[label] = QtGui.QRegion(
+                QtGui.QBitmap.fromImage(mono)).translated(left, top)
+            return region
+
+    def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
+        '''draws the image, and paints the segments whose color changed over it'''
+        super().paintEvent(a0)
+
+        if not hasattr(self, 'labels'):
+            return
+        changed = np.flatnonzero((self.colorLabels != self._base_colors).any(axis=1)).tolist()
+        if not changed:
+            return
+
+        # where the label draws its pixmap
+        origin = QtWidgets.QStyle.alignedRect(self.layoutDirection(), self.alignment(),
+                                              self.pixmap().size(), self.contentsRect()).topLeft()
+        with QtGui.QPainter(self) as p:
+            p: QtGui.QPainter  # for typehinting
+            p.translate(origin)
+            # replace the colour painted underneath rather than blending with it,
+            # so translucent segment colours don't build up
+            p.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_Source)
+            for label in changed:
+                p.setClipRegion(self._segmentRegion(label))
+                p.fillRect(self.pixmap().rect(), QtGui.QColor(*self.colorLabels[label].tolist()))
 
     def activeSegments(self) -> 'list[int]':
         '''return labels of currently active segment'''
-        return [l for l, c in self.colorLabels.items() if c == self._palette[True]]
+        return np.flatnonzero((self.colorLabels == self._palette[True]).all(axis=1)).tolist()
 
     def activeSegmentNames(self) -> 'list[str]':
         '''return names of currently active segments'''
         return [self._segment_names[l] for l in self.activeSegments()]
 
 
+class _SetNameAction(QtWidgets.QAction):
+    '''an action to set a segment name'''
+    newName = QtCore.pyqtSignal(int, str)
+
+    def __init__(self, *args, text='Set &Name', **kwargs) -> None:
+        super().__init__(text=text, *args, **kwargs)
+        self.dialog = QtWidgets.QInputDialog()
+        self.dialog.setWindowFlags(self.dialog.windowFlags() &
+                                   ~QtCore.Qt.WindowType.WindowContextHelpButtonHint)
+        self.setIcon(QtGui.QIcon(get_path_to_img('label.webp')))
+        self.dialog.setWindowTitle("Set segment name")
+        self.dialog.setLabelText('New segment name :')
+        self.dialog.accepted.connect(self._newName)
+
+        self.triggered.connect(self._showDialog)
+
+    def _showDialog(self):
+        '''internal callback'''
+        active = self.parentWidget().activeSegmentNames()
+        if len(active) == 1:  # only show if there's an active region
+            self.dialog.setTextValue(active[0])
+            self.dialog.show()
+
+    def _newName(self):
+        '''internal callback'''
+        l = self.parentWidget().activeSegments()[0]
+        lbl = self.dialog.textValue()
+        self.parentWidget().setLabelName(l, lbl)
+        self.newName.emit(l, lbl)
+
+
+class _ExportNamesAction(QtWidgets.QAction):
+    '''an action to export segment names to a json file'''
+
+    def __init__(self, parent: QtWidgets.QWidget, *args, text='&Export Names', **kwargs) -> None:
+        super().__init__(text, parent, *args, **kwargs)
+        self.setIcon(parent.style().standardIcon(
+            QtWidgets.QStyle.StandardPixmap.SP_ToolBarHorizontalExtensionButton))
+        self.triggered.connect(self._exportNames)
+
+    def _exportNames(self):
+        '''internal callback'''
+        filename = QtWidgets.QFileDialog.getSaveFileName(self.parentWidget(),
+                                                         'Choose the file to export to', image_label_folder,
+                                                         'JSON (*.json)')
+        if filename[0] != '':
+            outfile = filename[0] + (
+                '.json' if not filename[0].lower().endswith('.json') else '')
+
+            # json only has string keys
+            with open(outfile, 'w') as file:
+                json.dump({str(l): name for l, name in self.parentWidget()._segment_names.items()}, file)
+
+
+class _ImportNamesAction(QtWidgets.QAction):
+    '''an action to import segment names from a json file'''
+
+    def __init__(self, parent: QtWidgets.QWidget, *args, text='&Import Names', **kwargs) -> None:
+        super().__init__(text, parent, *args, **kwargs)
+
+        pxmp: QtGui.QPixmap = parent.style().standardIcon(
+            QtWidgets.QStyle.StandardPixmap.SP_ToolBarHorizontalExtensionButton).pixmap(QtCore.QSize(32, 32))
+        pxmp = pxmp.transformed(QtGui.QTransform(*[-1, 0, 0,
+                                                   0, 1, 0,
+                                                   0, 0, 1]), QtCore.Qt.TransformationMode.SmoothTransformation)
+        self.setIcon(QtGui.QIcon(pxmp))
+        self.triggered.connect(self._importNames)
+
+    def _importNames(self):
+        '''internal callback'''
+        filename = QtWidgets.QFileDialog.getOpenFileName(self.parentWidget(),
+                                                         'Choose the file to import from', image_label_folder,
+                                                         'JSON (*.json)')
+        if filename[0] != '':
+            infile = filename[0]
+            if not infile.lower().endswith('.json'):
+                infile += '.json'
+
+            with open(infile, 'r') as file:
+                self.parentWidget()._segment_names = {int(l): name for l, name in json.load(file).items()}
+            self.parentWidget()._hover_label = -1
+
+
 class ClickableSegmentImage(SegmentImage):
     '''
     an image with segments whose color can be set individually by clicking them,
@@ -251,94 +467,17 @@ class ClickableSegmentImage(SegmentImage):
                  *args, **kwargs):
         super().__init__(parent, flags, img_path, outline_img, *args, **kwargs)
 
-        class SetNameAction(QtWidgets.QAction):
-            '''an action to set a segment name'''
-            newName = QtCore.pyqtSignal(int, str)
-
-            def __init__(self, *args, text='Set &Name', **kwargs) -> None:
-                super().__init__(text=text, *args, **kwargs)
-                self.dialog = QtWidgets.QInputDialog()
-                self.dialog.setWindowFlags(self.dialog.windowFlags() &
-                                           ~QtCore.Qt.WindowType.WindowContextHelpButtonHint)
-                self.setIcon(QtGui.QIcon(get_path_to_img('label.webp')))
-                self.dialog.setWindowTitle("Set segment name")
-                self.dialog.setLabelText('New segment name :')
-                self.dialog.accepted.connect(self._newName)
-
-                self.triggered.connect(self._showDialog)
-
-            def _showDialog(self):
-                '''internal callback'''
-                active = self.parentWidget().activeSegmentNames()
-                if len(active) == 1:  # only show if there's an active region
-                    self.dialog.setTextValue(active[0])
-                    self.dialog.show()
-
-            def _newName(self):
-                '''internal callback'''
-                l = self.parentWidget().activeSegments()[0]
-                lbl = self.dialog.textValue()
-                self.parentWidget().setLabelName(l, lbl)
-                self.newName.emit(l, lbl)
-
-        class ExportNamesAction(QtWidgets.QAction):
-            '''an action to export segment names to pickle file'''
-
-            def __init__(self, parent: QtWidgets.QWidget, *args, text='&Export Names', **kwargs) -> None:
-                super().__init__(text, parent, *args, **kwargs)
-                self.setIcon(parent.style().standardIcon(
-                    QtWidgets.QStyle.StandardPixmap.SP_ToolBarHorizontalExtensionButton))
-                self.triggered.connect(self._exportNames)
-
-            def _exportNames(self):
-                '''internal callback'''
-                filename = QtWidgets.QFileDialog.getSaveFileName(self.parentWidget(),
-                                                                 'Choose the file to export to', image_label_folder,
-                                                                 'PICKLE (*.p)')
-                if filename[0] != '':
-                    outfile = filename[0] + (
-                        '.p' if not filename[0].lower().endswith('.p') else '')
-
-                    with open(outfile, 'wb') as file:
-                        pickle.dump(self.parentWidget()._segment_names, file)
-
-        class ImportNamesAction(QtWidgets.QAction):
-            '''an action to import segment names from a pickle file'''
-
-            def __init__(self, parent: QtWidgets.QWidget, *args, text='&Import Names', **kwargs) -> None:
-                super().__init__(text, parent, *args, **kwargs)
-
-                pxmp: QtGui.QPixmap = parent.style().standardIcon(
-                    QtWidgets.QStyle.StandardPixmap.SP_ToolBarHorizontalExtensionButton).pixmap(QtCore.QSize(32, 32))
-                pxmp = pxmp.transformed(QtGui.QTransform(*[-1, 0, 0,
-                                                           0, 1, 0,
-                                                           0, 0, 1]), QtCore.Qt.TransformationMode.SmoothTransformation)
-                self.setIcon(QtGui.QIcon(pxmp))
-                self.triggered.connect(self._importNames)
-
-            def _importNames(self):
-                '''internal callback'''
-                filename = QtWidgets.QFileDialog.getOpenFileName(self.parentWidget(),
-                                                                 'Choose the file to import from', image_label_folder,
-                                                                 'PICKLE (*.p)')
-                if filename[0] != '':
-                    infile = filename[0] + (
-                        '.p' if not filename[0].lower().endswith('.p') else '')
-
-                    with open(infile, 'rb') as file:
-                        self.parentWidget()._segment_names = pickle.load(file)
-
-        # add above-defined actions to the widget, and enable contextmenu
-        self.addActions([SetNameAction(parent=self),
-                         ExportNamesAction(parent=self),
-                         ImportNamesAction(parent=self)])
+        # add the actions to the widget, and enable contextmenu
+        self.addActions([_SetNameAction(parent=self),
+                         _ExportNamesAction(parent=self),
+                         _ImportNamesAction(parent=self)])
         self.setContextMenuPolicy(
             QtCore.Qt.ContextMenuPolicy.ActionsContextMenu)
 
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
         '''on click'''
-        lbl = self.labels[round(event.localPos().y()),
-                          round(event.localPos().x())]
+        pos = event.pos()
+        lbl = self._labels_view[pos.y(), pos.x()]
         self.setOnlySegmentActive(lbl)
         self.clicked.emit()
         self.clicked_segment.emit(lbl)
@@ -48,34 +48,35 @@ class Icosahedron(AbstractGeometry):
 class IsoSphere(Icosahedron):
     def __init__(self, subdivisions=2) -> None:
         super().__init__()
+        # don't extend the class-level vertices of the icosahedron
+        self.vertices = list(self.vertices)
 
         for div in range(subdivisions):
             self._subdivide()
 
     def _midpoint(self, p1, p2):
         p3 = [i + j for i, j in zip(p1, p2)]
-        p3n = np.sqrt(sum([p**2 for p in p3]))
+        p3n = math.sqrt(sum(p**2 for p in p3))
         return [p/p3n for p in p3]
 
     def _subdivide(self):
         new_faces = []
+        # the midpoint of each edge, by its (sorted) vertex indices, as edges are shared by two faces
+        midpoints: 'dict[tuple[int, int], int]' = {}
 
-        for i, face in enumerate(self.faces):
+        for face in self.faces:
 
             midpoint_idx = []
             for i in range(3):
-                mp = self._midpoint(self.vertices[face[i]],
-                                    self.vertices[face[(i+1) % 3]])
-
-                idx = [idx for idx, v in enumerate(self.vertices) if sum(
-                    (p1 - p2)**2 for p1, p2 in zip(mp, v)) < 1e-2]
-                if len(idx) > 0:
-                    midpoint_idx.append(idx[0])
-                else:
-                    self.vertices.append(mp)
+                a, b = face[i], face[(i+1) % 3]
+                edge = (a, b) if a < b else (b, a)
+                try:
+                    midpoint_idx.append(midpoints[edge])
+                except KeyError:
+                    self.vertices.append(self._midpoint(self.vertices[a], self.vertices[b]))
+                    midpoints[edge] = len(self.vertices)-1
                     midpoint_idx.append(len(self.vertices)-1)
 
-            # self.vertices.extend(midpoints)
             new_faces.append([face[0], midpoint_idx[0], midpoint_idx[2]])
             new_faces.append([midpoint_idx[0], face[1], midpoint_idx[1]])
             new_faces.append([midpoint_idx[2], midpoint_idx[1], face[2]])
@@ -119,35 +120,34 @@ class UVSphere(AbstractGeometry):
 
     def __init__(self, nb_gores: int = 6, nb_rows: int = 3) -> None:
 
-        self.vertices = [[0, 0, 1]]  # north pole
-        for theta in reversed(np.linspace(-np.pi/2, np.pi/2, nb_rows+2, True)[1:-1]):
-            for phi in np.linspace(0, 2*np.pi,  nb_gores, False):
-                self.vertices.append(
-                    [math.cos(phi)*math.cos(theta), math.sin(phi)*math.cos(theta), math.sin(theta)])
-        self.vertices.extend([[0, 0, -1]])  # south pole
+        # the rows, from top to bottom, and the gores around each row
+        theta = np.linspace(-np.pi/2, np.pi/2, nb_rows+2, True)[1:-1][::-1, None]
+        phi = np.linspace(0, 2*np.pi,  nb_gores, False)[None, :]
+        rings = np.stack(np.broadcast_arrays(np.cos(phi)*np.cos(theta),
+                                             np.sin(phi)*np.cos(theta),
+                                             np.sin(theta)), axis=-1).reshape(-1, 3)
+        self.vertices = np.concatenate(([[0, 0, 1]],  # north pole
+                                        rings,
+                                        [[0, 0, -1]]))  # south pole
 
         n = len(self.vertices) - 1
 
-        top_faces = [[0, g, 1+g % nb_gores]
-                     for g in range(1, nb_gores+1)]
-        bottom_faces = [[n-g-1, n-(g if g > 0 else nb_gores), n]
-                        for g in reversed(range(nb_gores))]
+        # the index of each gore on a ring, and of the next one around
+        g = np.arange(1, nb_gores+1)
+        g_next = 1 + g % nb_gores
+
+        top_faces = np.column_stack((np.zeros_like(g), g, g_next))
 
-        self.faces = top_faces
-        for r in range(nb_rows-1):
-            for g in range(1, nb_gores+1):
-                self.faces.append(  # upper triangle
-                    [r*nb_gores + g,
-                     r*nb_gores + 1 + g % nb_gores,
-                     (r+1)*nb_gores + g]
-                )
-                self.faces.append(  # lower triangle
-                    [r*nb_gores + 1 + g % nb_gores,
-                     (r+1)*nb_gores + g,
-                     (r+1)*nb_gores + 1 + g % nb_gores]
-                )
+        r = nb_gores*np.arange(nb_rows-1)[:, None]
+        upper = np.stack((r + g, r + g_next, r + nb_gores + g), axis=-1)
+        lower = np.stack((r + g_next, r + nb_gores + g, r + nb_gores + g_next), axis=-1)
+        # alternate upper and lower triangles along each ring
+        middle_faces = np.stack((upper, lower), axis=2).reshape(-1, 3)
 
-        self.faces.extend(bottom_faces)
+        g = g[::-1] - 1
+        bottom_faces = np.column_stack((n-g-1, n-np.where(g > 0, g, nb_gores), np.full_like(g, n)))
+
+        self.faces = np.concatenate((top_faces, middle_faces, bottom_faces))
 
 
 class UVNavball(UVSphere):
@@ -172,55 +172,44 @@ class UVNavball(UVSphere):
 
     def _colorize(self, nb_gores: int, pattern: str, density: int):
         n = len(self.faces)
-        self.face_colors = []
+        idx = np.arange(n)
+
+        # the top half gets the bright colors, the bottom half the dark ones
+        mod = np.where(idx < n//2, +1, -1)
+        # the faces around the poles alternate on their own
+        is_pole = (idx < nb_gores) | (idx >= n-nb_gores)
+        pole_keys = 1 + idx//density % 2
 
         # generate different patterns:
         if pattern.lower() == 'beachball':
-
-            for idx in range(len(self.faces)):
-                mod = +1 if idx < n//2 else -1
-
-                if idx < nb_gores or idx >= n-nb_gores:
-                    key = mod*(1 + idx//density % 2)
-                else:
-                    key = mod*(1 + idx//density//2 % 2)
-
-                self.face_colors.append(self.palette[key])
+            ring_keys = 1 + idx//density//2 % 2
 
         elif pattern.lower() == 'spiral':
-            for idx in range(len(self.faces)):
-                mod = +1 if idx < n//2 else -1
-
-                if idx < nb_gores or idx >= n-nb_gores:
-                    key = mod*(1 + idx//density % 2)
-                else:
-                    # current ring :
-                    r = (idx - nb_gores) // (2 * nb_gores) + 1
-                    # advance by one on every ring
-                    key = mod * \
-                        (1+((((idx-1 + 2*r) % (4*density)) >= (2*density))) % 2)
-
-                self.face_colors.append(self.palette[key])
+            # current ring :
+            r = (idx - nb_gores) // (2 * nb_gores) + 1
+            # advance by one on every ring
+            ring_keys = 1 + ((idx-1 + 2*r) % (4*density) >= 2*density)
 
         elif pattern.lower() == 'checkerboard':
-            for idx in range(len(self.faces)):
-                mod = +1 if idx < n//2 else -1
-
-                if idx < nb_gores or idx >= n-nb_gores:
-                    key = mod*(1 + idx//density % 2)
-                else:
-                    # current ring :
-                    r = ((idx - nb_gores) // (2 * nb_gores) + 1) // density
-                    # gore on the current ring
-                    g = (idx - nb_gores) % (2 * nb_gores) // density
-                    # advance by one on every ring
-                    key = mod*(1 + (int(g % 4 > 1) + r) % 2)
-
-                self.face_colors.append(self.palette[key])
+            # current ring :
+            r = ((idx - nb_gores) // (2 * nb_gores) + 1) // density
+            # gore on the current ring
+            g = (idx - nb_gores) % (2 * nb_gores) // density
+            # advance by one on every ring
+            ring_keys = 1 + ((g % 4 > 1) + r) % 2
 
         else:
             raise ValueError(f"The pattern {pattern} has not been implemented")
 
+        keys = mod * np.where(is_pole, pole_keys, ring_keys)
+
+        # look all the colors up at once, with the palette keys shifted to be >= 0
+        offset = -min(self.palette)
+        lut = np.zeros((max(self.palette) + offset + 1, 4))
+        for key, color in self.palette.items():
+            lut[key + offset] = color
+        self.face_colors = lut[keys + offset]
+
 
 class NavballWidget(QtWidgets.QLabel):
     def __init__(self, parent: QtWidgets.QWidget = None):
@@ -7,13 +7,27 @@ Date    :   09.2022
 Project :   PyQtTest
 '''
 
+import typing
 
-class ColorRGBA(tuple):
+
+class ColorRGBA(typing.NamedTuple):
     '''a class for handling color-related stuff'''
+    r: int
+    g: int
+    b: int
+    a: int = 255
+
+    @classmethod
+    def validated(cls, r: int, g: int, b: int, a=255) -> 'ColorRGBA':
+        '''
+        create a color from arbitrary input, checking that it is a valid color
 
-    def __new__(cls, r: int, g: int, b: int, a=255) -> 'ColorRGBA':
+        @parameters :
+        * `r`, `g`, `b` :   the color components, 0 <= c <= 255
+        * `a`           :   (optional) the alpha component. Default is opaque.
+        '''
         try:
-            self = tuple.__new__(cls, (int(r), int(g), int(b), int(a)))
+            self = cls(int(r), int(g), int(b), int(a))
         except ValueError:
             raise TypeError("ColorRGBA colors must be integers") from None
         for c in self:
@@ -21,15 +35,6 @@ class ColorRGBA(tuple):
                 raise ValueError("ColorRGBA colors must be 0 <= c <= 255")
         return self
 
-    @property
-    def r(self) -> int: return self[0]
-    @property
-    def g(self) -> int: return self[1]
-    @property
-    def b(self) -> int: return self[2]
-    @property
-    def a(self) -> int: return self[3]
-
 
 # define some colors
 red = ColorRGBA(255, 000, 000)